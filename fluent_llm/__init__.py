@@ -33,5 +33,5 @@ from .job_manager import JobManager
 from .llm_stub import plan_from_text
 from .capabilities import get_capabilities  # expose capabilities loader
 from .api import RobotAPI  # API façade for robot control
-from .policy import classify_step, is_allowed  # risk classification helpers
+from .policy import classify_step, classify_steps, is_allowed  # risk classification helpers
 from .llm_integration import generate_ir_from_text, repair_ir_job  # LLM planning utilities
\ No newline at end of file
@@ -28,7 +28,7 @@ from typing import Any, Dict, List, Optional
 
 from .job_manager import JobManager
 from .ir import IRJob
-from .capabilities import get_capabilities
+from .capabilities import get_capabilities, to_plain_data
 
 
 class RobotAPI:
@@ -62,9 +62,12 @@ class RobotAPI:
         Returns:
             A unique identifier for the submitted job.
 
-        TODO: Add idempotency key support to avoid duplicate job creation
-        on network retries.  Validate the IR object schema before
-        submission.
+        Resubmitting an identical job while it is still pending or running
+        (e.g. on a network retry) returns the existing job ID without
+        creating a duplicate; see :meth:`JobManager.submit`.
+
+        TODO: Support explicit client‑supplied idempotency keys.
+        Validate the IR object schema before submission.
         """
         return self.job_manager.submit(ir_job)
 
@@ -128,5 +131,7 @@ class RobotAPI:
 
         Equivalent to a ``GET /capabilities`` endpoint.  The registry
         describes the available worklist commands and global constraints.
+        Each call returns a plain‑dict copy of the shared registry, so the
+        result can be serialized (e.g. with ``json.dumps``) or modified.
         """
-        return get_capabilities()
+        return to_plain_data(get_capabilities())
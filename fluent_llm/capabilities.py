@@ -9,21 +9,44 @@ preflight validator and compiler to look up valid operations and their
 parameters.  See ``capabilities.yaml`` for the initial schema.
 
 If the YAML file cannot be parsed or is missing, ``get_capabilities``
-returns an empty dictionary.  This allows callers to handle the absence
+returns an empty mapping.  This allows callers to handle the absence
 of a registry gracefully.  In a production system, failure to load
 capabilities should be treated as a configuration error.
+
+Parsed files are cached in memory keyed by their modification time and
+size, so repeated lookups (e.g. one per API request or per compiled job)
+do not re-parse the YAML.  Editing a file on disk invalidates its entry
+on the next call.  Cached data is shared between callers and is
+therefore returned as read‑only mappings (lists become tuples).
+
+To speed up cold starts, each successful parse is also written as a
+pickle to a per‑user cache directory (``$XDG_CACHE_HOME/fluent_llm``,
+by default ``~/.cache/fluent_llm``), named after a BLAKE2b hash of the
+YAML file's path, modification time and size.  Later processes load the
+pickle without reading or parsing the YAML at all.  Failures to read or
+write the pickle are ignored.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import Any, Dict
+import pickle
+import tempfile
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 try:
     import yaml  # type: ignore
 except ImportError:  # pragma: no cover - PyYAML should be installed
     yaml = None  # type: ignore
 
+# Prefer the LibYAML‑backed loader, which parses several times faster than
+# the pure‑Python ``SafeLoader``.  It is only available when PyYAML was
+# built against libyaml; otherwise fall back transparently.
+if yaml is not None:
+    _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 _CAPABILITIES_FILE = os.path.join(os.path.dirname(__file__), "capabilities.yaml")
 
@@ -34,13 +57,140 @@ _CAPABILITIES_FILE = os.path.join(os.path.dirname(__file__), "capabilities.yaml"
 # defaults (script overrides worklist by default).
 _LIQUID_CLASS_FILE = os.path.join(os.path.dirname(__file__), "liquid_class_precedence.yaml")
 
+# Parsed YAML documents keyed by path.  Each entry stores the file's
+# ``st_mtime_ns`` and ``st_size`` at parse time alongside the frozen data
+# so that edits to the file invalidate the entry.
+_CAPS_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+# Directory holding pickled parses of the YAML files.  Bump the version
+# whenever the pickled representation changes so that stale entries from
+# an older release are ignored.
+_PICKLE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "fluent_llm",
+)
+_PICKLE_CACHE_VERSION = 2
+
+# Returned by get_capabilities when no registry can be loaded; read‑only
+# like a loaded registry, and one shared object so identity checks on the
+# registry stay valid.
+_EMPTY_REGISTRY: Mapping[str, Any] = MappingProxyType({})
+
+_DEFAULT_PRECEDENCE: Mapping[str, Any] = MappingProxyType(
+    {"default": "script", "advanced_worklist": "worklist"}
+)
+
+# Precedence mapping derived from the parsed liquid class file, stored
+# under "entry" together with the parsed data it was built from.
+_PRECEDENCE_CACHE: Dict[str, Tuple[Any, Mapping[str, Any]]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read‑only view of a parsed YAML value.
+
+    Mappings are wrapped in :class:`types.MappingProxyType` and lists are
+    converted to tuples, recursively, so that the shared cached instance
+    cannot be mutated by callers.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def to_plain_data(value: Any) -> Any:
+    """Return a mutable copy of a value returned by this module.
+
+    Read‑only mappings become dicts and tuples become lists, recursively,
+    giving the plain shape that ``json``, ``copy.deepcopy`` and ``pickle``
+    accept.  Use it when handing the registry to callers that serialize
+    or modify it.
+    """
+    if isinstance(value, Mapping):
+        return {k: to_plain_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain_data(v) for v in value]
+    return value
+
+
+def _pickle_path(path: str, st: os.stat_result) -> str:
+    """Return the pickle cache path for ``path`` as described by ``st``.
+
+    The name hashes the absolute path together with the file's
+    ``st_mtime_ns`` and ``st_size``, the same key as the in‑memory cache,
+    so an edit to the file selects a different entry.
+    """
+    key = f"{os.path.abspath(path)}\0{st.st_mtime_ns}\0{st.st_size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(_PICKLE_CACHE_DIR, f"{stem}.v{_PICKLE_CACHE_VERSION}.{digest}.pkl")
+
+
+def _parse_yaml(path: str, st: os.stat_result) -> Any:
+    """Parse the YAML file at ``path`` via the pickle cache.
+
+    A cache hit skips reading the YAML file entirely.  Writes go through
+    a temporary file and :func:`os.replace` so concurrent processes never
+    observe a partial pickle.
+    """
+    pickle_path = _pickle_path(path, st)
+    try:
+        with open(pickle_path, "rb") as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Corrupt or unreadable pickle; reparse and overwrite it
+        pass
+    with open(path, "rb") as fh:
+        data = yaml.load(fh.read(), Loader=_Loader)
+    tmp_path = None
+    try:
+        os.makedirs(_PICKLE_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_PICKLE_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+        tmp_path = None
+    except OSError:
+        # Cache directory not writable; the parsed data is still valid
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return data
+
+
+def _load_yaml_cached(path: str) -> Any:
+    """Parse ``path`` with PyYAML, reusing the cached result if unchanged.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file cannot be parsed.  Failed parses are
+            not cached.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CAPS_CACHE.get(path)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+    data = _freeze(_parse_yaml(path, st))
+    _CAPS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
-def get_capabilities() -> Dict[str, Any]:
+def get_capabilities() -> Mapping[str, Any]:
     """Load the capabilities and constraints from the YAML registry.
 
     Returns:
-        A dictionary containing the top‑level keys ``capabilities`` and
-        ``constraints`` if available, otherwise an empty dictionary.
+        A read‑only mapping containing the top‑level keys ``capabilities``
+        and ``constraints`` if available, otherwise an empty mapping.
+        The mapping is shared between callers; use :func:`to_plain_data`
+        for a copy that can be modified or serialized.
 
     The structure is defined by ``capabilities.yaml``.  Each entry under
     ``capabilities`` should specify a description and a list of
@@ -56,22 +206,21 @@ def get_capabilities() -> Dict[str, Any]:
     """
     if yaml is None:
         # PyYAML is not installed; return empty registry
-        return {}
+        return _EMPTY_REGISTRY
     try:
-        with open(_CAPABILITIES_FILE, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
-            if isinstance(data, dict):
-                return data  # type: ignore[return-value]
+        data = _load_yaml_cached(_CAPABILITIES_FILE)
+        if isinstance(data, Mapping):
+            return data
     except FileNotFoundError:
         # capabilities.yaml is missing; return empty
         pass
     except Exception:
         # Parsing failed; return empty registry
         pass
-    return {}
+    return _EMPTY_REGISTRY
 
 
-def get_liquid_class_precedence() -> Dict[str, Any]:
+def get_liquid_class_precedence() -> Mapping[str, Any]:
     """Load liquid class precedence rules from the dedicated YAML file.
 
     This helper reads ``liquid_class_precedence.yaml`` and returns a
@@ -85,29 +234,34 @@ def get_liquid_class_precedence() -> Dict[str, Any]:
     keys always being present and should provide sensible fallbacks.
 
     Returns:
-        A dictionary containing precedence rules.  The typical shape is
-        ``{'default': 'script', 'advanced_worklist': 'worklist'}``, but
-        any missing values will be filled with these defaults.
+        A read‑only mapping containing precedence rules.  The typical
+        shape is ``{'default': 'script', 'advanced_worklist': 'worklist'}``,
+        but any missing values will be filled with these defaults.  The
+        result is memoized until the file changes.
     """
     # If PyYAML is not available, return hard‑coded defaults.
     if yaml is None:
-        return {"default": "script", "advanced_worklist": "worklist"}
+        return _DEFAULT_PRECEDENCE
     try:
-        with open(_LIQUID_CLASS_FILE, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
-            if isinstance(data, dict):
-                prec = data.get("liquid_class_precedence", {})
-                # Provide defaults for missing keys
-                if not isinstance(prec, dict):
-                    prec = {}
-                return {
-                    "default": prec.get("default", "script"),
-                    "advanced_worklist": prec.get("advanced_worklist", "worklist"),
-                }
+        data = _load_yaml_cached(_LIQUID_CLASS_FILE)
+        if isinstance(data, Mapping):
+            cached = _PRECEDENCE_CACHE.get("entry")
+            if cached is not None and cached[0] is data:
+                return cached[1]
+            prec = data.get("liquid_class_precedence", {})
+            # Provide defaults for missing keys
+            if not isinstance(prec, Mapping):
+                prec = {}
+            result = MappingProxyType({
+                "default": prec.get("default", "script"),
+                "advanced_worklist": prec.get("advanced_worklist", "worklist"),
+            })
+            _PRECEDENCE_CACHE["entry"] = (data, result)
+            return result
     except FileNotFoundError:
         # No config file; fall back to defaults
         pass
     except Exception:
         # Any parsing error returns defaults
         pass
-    return {"default": "script", "advanced_worklist": "worklist"}
+    return _DEFAULT_PRECEDENCE
@@ -15,29 +15,135 @@ are optional or context dependent; consult the FluentControl manual to
 implement them correctly.
 """
 
-from typing import List
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 from .ir import IRJob, IRStep
 from .capabilities import get_liquid_class_precedence
 
 
-def well_to_position(well: str) -> int:
-    """Convert an alphanumeric well ID (e.g. 'A1') to a numeric position (1–96).
+# Numeric positions for every well ID on a 96‑well plate, precomputed
+# once so the compile loop does a single dict lookup per well.  Lower‑case
+# rows are included so lookups never need ``str.upper()``.
+_WELL_POS = {
+    f"{row}{col}": (col - 1) * 8 + row_index + 1
+    for row_index, rows in enumerate(zip("ABCDEFGH", "abcdefgh"))
+    for row in rows
+    for col in range(1, 13)
+}
 
-    The mapping is based on Tecan's convention where wells are counted
-    from rear to front and left to right, with eight rows (A–H) in each
-    column.  For example, A2 → 9【6713682743180†L91-L97】.
+
+# Bound formatters for the Aspirate (A) and Dispense (D) records.  Format:
+# A;RackLabel;RackID;RackType;Position;TubeID;Volume;LiquidClass;TipType;TipMask;ForcedRackType
+# Each takes a (labware, position, volume, liquid_class) tuple.
+_A = "A;%s;;;%d;;%.2f;%s;;;".__mod__
+_D = "D;%s;;;%d;;%.2f;%s;;;".__mod__
+
+
+def _parse_well(well: str) -> int:
+    """Compute a well position arithmetically.
+
+    Used for well IDs that are not in the lookup table, such as
+    zero‑padded variants ('A01'), and to report invalid IDs.  Works on
+    the ASCII bytes directly: OR‑ing 0x20 folds 'A'–'H' onto 'a'–'h'
+    without allocating an upper‑cased copy.
     """
-    row = well[0].upper()
-    col = int(well[1:])
-    row_index = ord(row) - ord('A')
+    raw = well.encode("ascii", "replace")
+    row_index = (raw[0] | 0x20) - 0x61
     # Ensure row_index is between 0 and 7
     if not (0 <= row_index < 8):
         raise ValueError(f"Invalid row letter in well ID: {well}")
+    col = int(raw[1:])
     if col < 1 or col > 12:
         raise ValueError(f"Column out of range in well ID: {well}")
     return (col - 1) * 8 + row_index + 1
 
 
+def well_to_position(well: str) -> int:
+    """Convert an alphanumeric well ID (e.g. 'A1') to a numeric position (1–96).
+
+    The mapping is based on Tecan's convention where wells are counted
+    from rear to front and left to right, with eight rows (A–H) in each
+    column.  For example, A2 → 9【6713682743180†L91-L97】.
+    """
+    pos = _WELL_POS.get(well)
+    if pos is None:
+        return _parse_well(well)
+    return pos
+
+
+def wells_to_positions(wells: Sequence[str]) -> List[int]:
+    """Convert a sequence of well IDs to numeric positions in one pass.
+
+    Equivalent to ``[well_to_position(w) for w in wells]`` but resolves
+    canonical IDs straight from the lookup table, only falling back to
+    :func:`well_to_position` for other spellings.
+
+    Raises:
+        ValueError: For the first invalid well ID in ``wells``.
+    """
+    lookup = _WELL_POS.get
+    return [lookup(well) or well_to_position(well) for well in wells]
+
+
+def _prefer_worklist_class() -> bool:
+    """Return whether worklist‑defined liquid classes take precedence.
+
+    The precedence configuration tells us whether to prefer the liquid
+    class defined in the script or the worklist when compiling advanced
+    operations.  It falls back to sensible defaults if the configuration
+    is absent.
+    """
+    precedence = get_liquid_class_precedence()
+    return precedence.get("advanced_worklist", "worklist") == "worklist"
+
+
+def _compile_transfer(step: IRStep, prefer_worklist_class: bool) -> Tuple[str, ...]:
+    """Compile a transfer step into an Aspirate (A) and a Dispense (D) record."""
+    src_labware = step.args.get("source_labware")
+    src_well = step.args.get("source_well")
+    dest_labware = step.args.get("dest_labware")
+    dest_well = step.args.get("dest_well")
+    vol = step.args.get("volume_uL")
+    # Resolve the liquid class based on precedence.  IR steps may
+    # optionally specify a ``worklist_liquid_class`` argument to
+    # indicate the class that should be written into the GWL file.
+    # If advanced worklists are configured to take precedence,
+    # prefer the worklist‑defined class when present.  Otherwise
+    # default to the script‑defined class or "Water".
+    liquid_class = step.args.get("liquid_class")
+    if liquid_class is None:
+        liquid_class = "Water"
+    if prefer_worklist_class and step.args.get("worklist_liquid_class"):
+        liquid_class = step.args.get("worklist_liquid_class")
+    if None in (src_labware, src_well, dest_labware, dest_well, vol):
+        raise ValueError(f"Missing argument for transfer in step {step.id}")
+    src_pos = well_to_position(src_well)
+    dest_pos = well_to_position(dest_well)
+    return (
+        _A((src_labware, src_pos, vol, liquid_class)),
+        _D((dest_labware, dest_pos, vol, liquid_class)),
+    )
+
+
+def _compile_wash(step: IRStep, prefer_worklist_class: bool) -> Tuple[str, ...]:
+    """Compile a wash step.  Format: W<scheme>;"""
+    return (f"W{step.args.get('scheme', 1)};",)
+
+
+def _compile_decontaminate(step: IRStep, prefer_worklist_class: bool) -> Tuple[str, ...]:
+    """Compile a decontamination wash.  Format: WD;"""
+    return ("WD;",)
+
+
+# Record builders per IR operation.  Each takes the step and the liquid
+# class precedence flag and returns the step's worklist lines.  Register
+# new operations (mix, flush, break, ...) here.
+_COMPILERS: Dict[str, Callable[[IRStep, bool], Tuple[str, ...]]] = {
+    "transfer": _compile_transfer,
+    "wash": _compile_wash,
+    "decontaminate": _compile_decontaminate,
+}
+
+
 def compile_ir(job: IRJob) -> List[str]:
     """Compile an IR job into a list of worklist record lines.
 
@@ -51,49 +157,43 @@ def compile_ir(job: IRJob) -> List[str]:
         ValueError: If an unknown operation is encountered or required
             arguments are missing.
     """
-    worklist_lines: List[str] = []
-    # Load liquid class precedence once per job.  This mapping tells us
-    # whether to prefer the liquid class defined in the script or the
-    # worklist when compiling advanced operations.  It falls back to
-    # sensible defaults if the configuration is absent.
-    precedence = get_liquid_class_precedence()
-    prefer_worklist_class = precedence.get("advanced_worklist", "worklist") == "worklist"
+    return list(iter_compile_ir(job))
+
 
+def iter_compile_ir(job: IRJob) -> Iterator[str]:
+    """Compile an IR job lazily, yielding one worklist record line at a time.
+
+    Produces the same lines as :func:`compile_ir` without holding the
+    whole worklist in memory, which suits very large jobs that are
+    written straight to a file (see :func:`write_worklist`).  Because the
+    job is compiled on demand, a ``ValueError`` for an invalid step is
+    raised during iteration, after the lines for earlier steps have been
+    yielded.
+    """
+    prefer_worklist_class = _prefer_worklist_class()
     for step in job.steps:
-        if step.op == "transfer":
-            src_labware = step.args.get("source_labware")
-            src_well = step.args.get("source_well")
-            dest_labware = step.args.get("dest_labware")
-            dest_well = step.args.get("dest_well")
-            vol = step.args.get("volume_uL")
-            # Resolve the liquid class based on precedence.  IR steps may
-            # optionally specify a ``worklist_liquid_class`` argument to
-            # indicate the class that should be written into the GWL file.
-            # If advanced worklists are configured to take precedence,
-            # prefer the worklist‑defined class when present.  Otherwise
-            # default to the script‑defined class or "Water".
-            liquid_class = step.args.get("liquid_class", "Water")
-            if prefer_worklist_class and step.args.get("worklist_liquid_class"):
-                liquid_class = step.args.get("worklist_liquid_class")
-            if None in (src_labware, src_well, dest_labware, dest_well, vol):
-                raise ValueError(f"Missing argument for transfer in step {step.id}")
-            src_pos = well_to_position(src_well)
-            dest_pos = well_to_position(dest_well)
-            # Build Aspirate record (A)
-            # Format: A;RackLabel;RackID;RackType;Position;TubeID;Volume;LiquidClass;TipType;TipMask;ForcedRackType
-            aspirate_line = f"A;{src_labware};;;{src_pos};;{vol:.2f};{liquid_class};;;"
-            # Build Dispense record (D)
-            dispense_line = f"D;{dest_labware};;;{dest_pos};;{vol:.2f};{liquid_class};;;"
-            worklist_lines.append(aspirate_line)
-            worklist_lines.append(dispense_line)
-        elif step.op == "wash":
-            scheme = step.args.get("scheme", 1)
-            # Format: W<scheme>;
-            worklist_lines.append(f"W{scheme};")
-        elif step.op == "decontaminate":
-            # Format: WD;
-            worklist_lines.append("WD;")
-        else:
+        try:
+            handler = _COMPILERS[step.op]
+        except KeyError:
             # Unknown operations cause compilation failure
-            raise ValueError(f"Unknown operation '{step.op}' in step {step.id}")
-    return worklist_lines
\ No newline at end of file
+            raise ValueError(f"Unknown operation '{step.op}' in step {step.id}") from None
+        yield from handler(step, prefer_worklist_class)
+
+
+def write_worklist(job: IRJob, path: str) -> int:
+    """Compile ``job`` and stream the worklist to a .gwl file at ``path``.
+
+    Lines are written as they are compiled, so memory use does not grow
+    with the size of the job.  If compilation fails part way, the file
+    contains the lines for the steps before the failing one.
+
+    Returns:
+        The number of lines written.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        for line in iter_compile_ir(job):
+            fh.write(line)
+            fh.write("\n")
+            count += 1
+    return count
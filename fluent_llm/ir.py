@@ -10,11 +10,20 @@ Tecan's worklist command documentation for a complete list of
 record types【6713682743180†L32-L40】.
 """
 
+import json
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
+# Jobs can contain thousands of steps, so the IR dataclasses use
+# ``__slots__`` to drop the per‑instance ``__dict__``.  ``slots=True`` is
+# only available from Python 3.10; older interpreters keep plain
+# dataclasses because hand‑written ``__slots__`` conflict with field
+# defaults.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class IRStep:
     """A single step in an IR job.
 
@@ -37,7 +46,19 @@ class IRStep:
     preconditions: List[str] = field(default_factory=list)
 
 
-@dataclass
+# Step arguments exposed as columns by :meth:`IRJob.as_columns`.
+_COLUMN_ARGS = (
+    "source_labware",
+    "source_well",
+    "dest_labware",
+    "dest_well",
+    "volume_uL",
+    "liquid_class",
+    "worklist_liquid_class",
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class IRJob:
     """A collection of IR steps along with job‑level metadata.
 
@@ -56,4 +77,95 @@ class IRJob:
     job_id: str
     name: Optional[str] = None
     steps: List[IRStep] = field(default_factory=list)
-    constraints: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    constraints: Dict[str, Any] = field(default_factory=dict)
+
+    def as_columns(self) -> Dict[str, List[Any]]:
+        """Return the steps as parallel lists (a column‑oriented view).
+
+        The result maps ``"id"`` and ``"op"`` plus each transfer argument
+        (``source_labware``, ``source_well``, ``dest_labware``,
+        ``dest_well``, ``volume_uL``, ``liquid_class`` and
+        ``worklist_liquid_class``) to a list with one entry per step, in
+        step order.  Arguments a step does not define are ``None``.  Bulk
+        consumers can then process a column at a time instead of looking
+        up each step's ``args`` dict repeatedly.
+
+        The view is a snapshot; it does not track later edits to
+        ``steps``.
+        """
+        steps = self.steps
+        columns: Dict[str, List[Any]] = {
+            "id": [step.id for step in steps],
+            "op": [step.op for step in steps],
+        }
+        for key in _COLUMN_ARGS:
+            columns[key] = [step.args.get(key) for step in steps]
+        return columns
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "IRJob":
+        """Build a job from plain data, e.g. the parsed JSON emitted by an LLM.
+
+        ``data`` uses the field names of :class:`IRJob` and, under
+        ``steps``, those of :class:`IRStep` (the shape produced by
+        ``dataclasses.asdict``).  Only ``version``, ``job_id`` and each
+        step's ``id`` and ``op`` are required.  Dicts and lists are used
+        as given rather than copied.
+
+        Raises:
+            ValueError: If a required field is missing or a field has the
+                wrong shape (e.g. ``steps`` is not a list, a step's
+                ``args`` is not a mapping, or ``job_id``, ``version``,
+                ``name`` or a step's ``id`` or ``op`` is not a string;
+                ``name`` may also be ``None``).
+        """
+        _expect(data, Mapping, "job")
+        steps = data.get("steps", [])
+        _expect(steps, list, "steps")
+        name = data.get("name")
+        if name is not None:
+            _expect(name, str, "job name")
+        return cls(
+            version=_expect(_require(data, "version", "job"), str, "job version"),
+            job_id=_expect(_require(data, "job_id", "job"), str, "job job_id"),
+            name=name,
+            steps=[_step_from_dict(step, index) for index, step in enumerate(steps)],
+            constraints=_expect(data.get("constraints", {}), dict, "constraints"),
+        )
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "IRJob":
+        """Decode a job from a JSON document (see :meth:`from_dict`).
+
+        Raises:
+            ValueError: If ``raw`` is not valid JSON or lacks a required
+                field.
+        """
+        return cls.from_dict(json.loads(raw))
+
+
+def _expect(value: Any, kind: type, where: str) -> Any:
+    """Return ``value`` if it is a ``kind``, else raise ValueError."""
+    if not isinstance(value, kind):
+        raise ValueError(f"Invalid IR {where}: expected {kind.__name__}, got {type(value).__name__}")
+    return value
+
+
+def _require(data: Mapping[str, Any], key: str, where: str) -> Any:
+    """Return ``data[key]``, raising ValueError if it is missing."""
+    try:
+        return data[key]
+    except KeyError:
+        raise ValueError(f"Missing IR field '{key}' in {where}") from None
+
+
+def _step_from_dict(data: Any, index: int) -> IRStep:
+    """Build one :class:`IRStep` for :meth:`IRJob.from_dict`."""
+    where = f"step {index}"
+    _expect(data, Mapping, where)
+    return IRStep(
+        id=_expect(_require(data, "id", where), str, f"{where} id"),
+        op=_expect(_require(data, "op", where), str, f"{where} op"),
+        args=_expect(data.get("args", {}), dict, f"{where} args"),
+        preconditions=_expect(data.get("preconditions", []), list, f"{where} preconditions"),
+    )
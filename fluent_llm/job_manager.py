@@ -5,16 +5,48 @@ validation, compiles jobs into worklists, simulates them (as a dry run),
 and (in a real deployment) would dispatch compiled worklists to the
 robot control interface.  For this prototype, execution is simulated.
 
+By default jobs run synchronously when :meth:`JobManager.run_next` is
+called.  Passing ``max_workers`` enables a thread pool: submitted jobs
+are scheduled immediately and several jobs execute concurrently, with
+results available through :meth:`JobManager.result`.
+
 TODO: Add support for pausing, resuming, aborting jobs, concurrency
 control, and integrating with a real Fluent control API.
 """
 
-from typing import List, Dict, Any, Optional
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from .ir import IRJob
-from .preflight import preflight_check
+from .preflight import format_preflight_errors, get_step_validator, preflight_check
 from .compiler import compile_ir
-from .simulator import simulate_ir
-from .state import ErrorType, RecoveryAction
+from .policy import classify_step
+from .simulator import Simulation
+from .state import ErrorType, JobState, RecoveryAction
+
+
+# Valid status transitions as (current state, event) -> next state.  Any
+# pair not listed is ignored, so e.g. pausing a pending job or aborting a
+# completed one leaves the status unchanged.  A paused job may still
+# complete because the simulated execution does not honour pauses.
+_TRANSITIONS: Dict[Tuple[JobState, str], JobState] = {
+    (JobState.PENDING, "start"): JobState.RUNNING,
+    (JobState.PENDING, "abort"): JobState.ABORTED,
+    (JobState.RUNNING, "pause"): JobState.PAUSED,
+    (JobState.RUNNING, "complete"): JobState.COMPLETED,
+    (JobState.RUNNING, "fail"): JobState.ERROR,
+    (JobState.RUNNING, "abort"): JobState.ABORTED,
+    (JobState.PAUSED, "resume"): JobState.RUNNING,
+    (JobState.PAUSED, "complete"): JobState.COMPLETED,
+    (JobState.PAUSED, "fail"): JobState.ERROR,
+    (JobState.PAUSED, "abort"): JobState.ABORTED,
+}
+
+# States a job never leaves.  Jobs reaching one are no longer considered
+# for duplicate detection, so the same job may be submitted again.
+_TERMINAL_STATES = frozenset({JobState.COMPLETED, JobState.ERROR, JobState.ABORTED})
 
 
 class JobManager:
@@ -29,17 +61,42 @@ class JobManager:
 
     Attributes:
         deck_state: A mapping of labware names to metadata (e.g. positions).
-        queue: FIFO list of IR jobs awaiting execution.
-        job_status: Mapping of job IDs to status strings.
+        queue: FIFO deque of IR jobs awaiting execution.  Aborted jobs
+            are left in place as tombstones and skipped by ``run_next``.
+        job_status: Mapping of job IDs to :class:`JobState` values (which
+            compare equal to the plain status strings).
         error_policy: Mapping of ErrorType to RecoveryAction.  Determines what
             to do when preflight or execution errors occur.
+
+    Args:
+        deck_state: Initial deck state.
+        max_workers: If given, jobs are executed on a thread pool of this
+            size as soon as they are submitted instead of waiting for
+            ``run_next``.  Use ``os.cpu_count()`` for one worker per core.
     """
 
-    def __init__(self, deck_state=None):
+    def __init__(self, deck_state=None, max_workers: Optional[int] = None):
         self.deck_state = deck_state or {}
-        self.queue: List[IRJob] = []
+        # Guards the queue, the pending index and job statuses, which are
+        # shared with pool workers when max_workers is set.
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_workers) if max_workers else None
+        )
+        self._futures: Dict[str, Future] = {}
+        # Pending jobs as (sequence token, job) in submission order.
+        self.queue: Deque[Tuple[int, IRJob]] = deque()
+        # Sequence token of each pending job, keyed by job_id.  A queue entry
+        # is live only while its token is the indexed one for its ID, which
+        # makes abort O(1) and keeps stale entries of a resubmitted job from
+        # running in its old position.
+        self._queue_index: Dict[str, int] = {}
+        self._sequence = itertools.count()
         # Track job statuses keyed by job_id. New jobs are "pending" until run.
-        self.job_status: Dict[str, str] = {}
+        self.job_status: Dict[str, JobState] = {}
+        # Accepted jobs that have not reached a terminal state, keyed by
+        # job_id, used to make resubmission idempotent.
+        self._active: Dict[str, IRJob] = {}
         # Default policy: abort on any error
         self.error_policy = {
             ErrorType.LABWARE_NOT_FOUND: RecoveryAction.ABORT,
@@ -48,6 +105,7 @@ class JobManager:
             ErrorType.PRECONDITION_FAILED: RecoveryAction.ABORT,
             ErrorType.TIP_NOT_AVAILABLE: RecoveryAction.ABORT,
             ErrorType.MOTION_ERROR: RecoveryAction.ABORT,
+            ErrorType.INVALID_ARGUMENT: RecoveryAction.ABORT,
         }
 
     def submit(self, job: IRJob) -> str:
@@ -56,16 +114,97 @@ class JobManager:
         If validation fails, the job is not enqueued and a ValueError is
         raised.  In a real system, you might instead place the job in a
         'validation failed' state and allow user correction.
+
+        Submission is idempotent while a job is pending, running or
+        paused: submitting an identical job (same job_id and content) again
+        is not validated or enqueued twice, and the job ID is returned.
+        Once the job has completed, failed or been aborted it can be
+        submitted again and runs anew.  Submitting a different job under
+        the job_id of an active job raises a ValueError.
         """
+        if self._is_active_duplicate(job):
+            return job.job_id
         errors = preflight_check(job, self.deck_state)
         if errors:
-            messages = [f"{step_id}: {error.name} – {msg}" for step_id, error, msg in errors]
-            raise ValueError("Preflight check failed:\n" + "\n".join(messages))
-        self.queue.append(job)
-        # Record the job status as pending
-        self.job_status[job.job_id] = "pending"
+            raise ValueError("Preflight check failed:\n" + "\n".join(format_preflight_errors(errors)))
+        self._enqueue([job])
         return job.job_id
 
+    def submit_many(self, jobs: List[IRJob]) -> List[str]:
+        """Validate and enqueue several jobs at once.
+
+        All jobs are preflight checked before any of them is enqueued, so
+        the batch is atomic: if any job fails validation a ValueError is
+        raised and neither the queue nor the job statuses are modified.
+        Useful when a planner produces a multi‑job workflow in one go.
+        Duplicates of active jobs, and repeats of a job within the batch,
+        are skipped as in ``submit``; a different job reusing one of those
+        job_ids raises a ValueError without enqueuing any of the batch.
+
+        Returns:
+            The job IDs of the submitted jobs, in submission order.
+        """
+        entries = [job for job in jobs if not self._is_active_duplicate(job)]
+        messages: List[str] = []
+        for job in entries:
+            errors = preflight_check(job, self.deck_state)
+            messages.extend(format_preflight_errors(errors, prefix=f"{job.job_id}/"))
+        if messages:
+            raise ValueError("Preflight check failed:\n" + "\n".join(messages))
+        self._enqueue(entries)
+        return [job.job_id for job in jobs]
+
+    def _is_active_duplicate(self, job: IRJob) -> bool:
+        """Return whether ``job`` is already active under its job_id.
+
+        Raises:
+            ValueError: If a different job is active under the same job_id.
+        """
+        with self._lock:
+            return self._check_active(job)
+
+    def _check_active(self, job: IRJob) -> bool:
+        """Lock‑held body of :meth:`_is_active_duplicate`."""
+        existing = self._active.get(job.job_id)
+        if existing is None:
+            return False
+        # Identity first; dataclass equality only compares content when a
+        # different object reuses the job_id
+        if existing is job or existing == job:
+            return True
+        raise ValueError(f"Job {job.job_id} is already active with different content")
+
+    def _enqueue(self, entries: List[IRJob]) -> None:
+        """Record validated jobs as pending and schedule them if pooled.
+
+        Active jobs are checked again under the lock so that concurrent
+        duplicate submissions enqueue the job only once.  Every entry,
+        including repeats of a job_id within ``entries``, is checked before
+        anything is recorded, so a conflict leaves the manager unchanged.
+
+        Raises:
+            ValueError: If two different jobs share a job_id, either with an
+                active job or within ``entries``.
+        """
+        with self._lock:
+            batch: Dict[str, IRJob] = {}
+            for job in entries:
+                if self._check_active(job):
+                    continue
+                seen = batch.setdefault(job.job_id, job)
+                if seen is not job and seen != job:
+                    raise ValueError(f"Job {job.job_id} is submitted twice with different content")
+            jobs = list(batch.values())
+            self._active.update(batch)
+            queued = [(next(self._sequence), job) for job in jobs]
+            self._queue_index.update({job.job_id: seq for seq, job in queued})
+            self.job_status.update({job.job_id: JobState.PENDING for job in jobs})
+            if self._pool is None:
+                self.queue.extend(queued)
+                return
+            for seq, job in queued:
+                self._futures[job.job_id] = self._pool.submit(self._run_pooled, seq, job)
+
     def run_next(self):
         """Compile and simulate the next job in the queue.
 
@@ -75,32 +214,138 @@ class JobManager:
             simulation_state is a dict of labware volumes after simulation.
 
         Raises:
-            IndexError: If no jobs are queued.
+            IndexError: If no jobs are queued.  When the manager uses a
+                worker pool the queue is always empty; use ``result``.
+            ValueError: If the job no longer passes preflight against the
+                current deck state, or the risk policy blocks one of its
+                steps.  The job is marked ``error``.
         """
-        if not self.queue:
-            raise IndexError("No jobs queued")
-        job = self.queue.pop(0)
-        # Mark job as running
-        self.job_status[job.job_id] = "running"
-        # Compile
-        worklist_lines = compile_ir(job)
-        # Simulate execution
-        sim_state = simulate_ir(job)
-        # Mark job as completed
-        self.job_status[job.job_id] = "completed"
+        with self._lock:
+            if not self.queue or not self._queue_index:
+                raise IndexError("No jobs queued")
+            # Skip tombstones left behind by abort()
+            while True:
+                seq, job = self.queue.popleft()
+                if self._queue_index.get(job.job_id) == seq:
+                    del self._queue_index[job.job_id]
+                    break
+            self._transition(job.job_id, "start")
+        return self._execute(job)
+
+    def _run_pooled(self, seq: int, job: IRJob):
+        """Pool entry point: start ``job`` unless it was aborted meanwhile."""
+        with self._lock:
+            if self._queue_index.get(job.job_id) != seq:
+                return None
+            del self._queue_index[job.job_id]
+            self._transition(job.job_id, "start")
+        return self._execute(job)
+
+    def _execute(self, job: IRJob):
+        """Compile and simulate a job already marked as running."""
+        try:
+            worklist_lines, sim_state = self._execute_fused(job)
+        except Exception:
+            with self._lock:
+                self._transition(job.job_id, "fail")
+            raise
+        # Aborted jobs stay aborted; the transition is simply ignored
+        with self._lock:
+            self._transition(job.job_id, "complete")
         return worklist_lines, sim_state
 
+    def _execute_fused(self, job: IRJob) -> Tuple[List[str], Dict[str, List[float]]]:
+        """Validate, classify and simulate ``job`` in one pass, then compile it.
+
+        Each step is re‑validated against the current deck state, checked
+        with :func:`classify_step` and applied to the simulated volumes
+        before moving on to the next step, so the job is walked once for
+        all three.  The worklist is then produced by :func:`compile_ir`,
+        which keeps its column‑wise fast path for all‑transfer jobs.
+        Useful when the deck may have changed since the job was submitted.
+
+        Raises:
+            ValueError: At the first step that fails preflight validation
+                or whose operation the risk policy blocks.  Nothing from
+                the job is returned in that case.
+        """
+        validate_step = get_step_validator()
+        deck_state = self.deck_state
+        simulation = Simulation()
+        for step in job.steps:
+            errors = validate_step(step, deck_state)
+            if errors:
+                raise ValueError("Preflight check failed:\n" + "\n".join(format_preflight_errors(errors)))
+            if classify_step(step) == "block":
+                raise ValueError(f"Operation '{step.op}' in step {step.id} is blocked by policy")
+            simulation.apply(step)
+        return compile_ir(job), simulation.state()
+
+    def _transition(self, job_id: str, event: str) -> bool:
+        """Apply ``event`` to a job's status using ``_TRANSITIONS``.
+
+        Must be called with ``self._lock`` held.  Returns ``True`` if the
+        status changed.
+        """
+        new_state = _TRANSITIONS.get((self.job_status.get(job_id), event))
+        if new_state is None:
+            return False
+        self.job_status[job_id] = new_state
+        if new_state in _TERMINAL_STATES:
+            self._active.pop(job_id, None)
+        return True
+
+    def result(self, job_id: str, timeout: Optional[float] = None):
+        """Wait for a pooled job and return its ``run_next``‑style result.
+
+        Args:
+            job_id: The identifier returned by ``submit``.
+            timeout: Maximum number of seconds to wait.
+
+        Each result is handed out once: after the job's outcome has been
+        returned or raised, the manager stops tracking it.
+
+        Returns:
+            The (worklist_lines, simulation_state) tuple, or ``None`` if the
+            job was aborted before it started.
+
+        Raises:
+            KeyError: If the job was not scheduled on the worker pool or its
+                result was already collected.
+            concurrent.futures.TimeoutError: If the job did not finish
+                within ``timeout``; the result can still be collected later.
+            Exception: Any error raised while compiling or simulating.
+        """
+        with self._lock:
+            future = self._futures[job_id]
+        try:
+            return future.result(timeout)
+        except CancelledError:
+            return None
+        finally:
+            if future.done():
+                with self._lock:
+                    # A resubmission may have scheduled a new future
+                    if self._futures.get(job_id) is future:
+                        del self._futures[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool, if any, optionally waiting for jobs."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
     # ------------------------------------------------------------------
     # Job status and control methods
     # ------------------------------------------------------------------
-    def status(self, job_id: str) -> Optional[str]:
+    def status(self, job_id: str) -> Optional[JobState]:
         """Return the current status of the specified job.
 
         Args:
             job_id: The job identifier.
 
         Returns:
-            The status string or ``None`` if unknown.
+            The job state (equal to its status string) or ``None`` if
+            unknown.
         """
         return self.job_status.get(job_id)
 
@@ -110,41 +355,48 @@ class JobManager:
         Transitions the status from ``running`` to ``paused``.  In a
         real implementation this would send a pause command to the robot.
         """
-        if self.job_status.get(job_id) == "running":
-            self.job_status[job_id] = "paused"
+        with self._lock:
+            self._transition(job_id, "pause")
 
     def resume(self, job_id: str) -> None:
         """Resume a paused job.
 
         Transitions the status from ``paused`` to ``running``.
         """
-        if self.job_status.get(job_id) == "paused":
-            self.job_status[job_id] = "running"
+        with self._lock:
+            self._transition(job_id, "resume")
 
     def abort(self, job_id: str) -> None:
         """Abort a job.
 
-        Sets the status to ``aborted`` and removes it from the queue if
-        pending.  Does not stop execution of a job currently running in
-        ``run_next`` because this prototype executes synchronously.
+        Sets the status of a pending, running or paused job to
+        ``aborted`` and removes it from the queue if pending.  Pooled jobs
+        that have not started are cancelled.  Does not stop execution of a
+        job that is already running.  Finished and unknown jobs are left
+        unchanged.
         """
-        # Remove from queue if still pending
-        for idx, job in enumerate(self.queue):
-            if job.job_id == job_id:
-                del self.queue[idx]
-                break
-        self.job_status[job_id] = "aborted"
+        with self._lock:
+            if not self._transition(job_id, "abort"):
+                return
+            # Drop from the pending index; run_next discards the queue entry
+            self._queue_index.pop(job_id, None)
+            future = self._futures.get(job_id)
+            if future is not None:
+                future.cancel()
 
     @property
     def state(self) -> Dict[str, Any]:
         """Return a snapshot of the job manager's state.
 
         Includes the deck state, the number of queued jobs and the
-        current status of all known jobs.  Extend this method to include
-        additional robot sensor and state information.
+        current status of all known jobs.  ``job_status`` is a copy
+        taken under the lock; ``deck_state`` is the manager's own deck
+        mapping.  Extend this method to include additional robot sensor
+        and state information.
         """
-        return {
-            "deck_state": self.deck_state,
-            "queued_jobs": len(self.queue),
-            "job_status": dict(self.job_status),
-        }
\ No newline at end of file
+        with self._lock:
+            return {
+                "deck_state": self.deck_state,
+                "queued_jobs": len(self._queue_index),
+                "job_status": dict(self.job_status),
+            }
@@ -11,12 +11,42 @@ correct plan is produced or a maximum number of attempts is reached.
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
 
 from .llm_stub import plan_from_text
 from .ir import IRJob
 from .state import ErrorType
-from .preflight import preflight_check
+from .preflight import format_preflight_errors, preflight_check
+
+
+# In‑flight planning requests keyed by :func:`_request_key`.  Concurrent
+# identical requests (retries, duplicate clicks) wait on the first
+# caller's future instead of issuing their own planner call.
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Least‑recently‑used cache of validated plans, guarded by
+# ``_INFLIGHT_LOCK``.  Entries are never handed out directly; callers
+# receive deep copies so they can mutate the returned job freely.
+_PLAN_CACHE: "OrderedDict[str, IRJob]" = OrderedDict()
+_PLAN_CACHE_SIZE = 256
+
+
+def _request_key(description: str, deck_state) -> str:
+    """Return a digest identifying a planning request.
+
+    Validation only consults which labware labels are present, so the
+    deck state contributes its sorted labels.  ``None`` (no validation)
+    is kept distinct from an empty deck.
+    """
+    labware = None if deck_state is None else sorted(deck_state)
+    payload = f"{description}\0{labware!r}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def generate_ir_from_text(description: str, deck_state=None) -> IRJob:
@@ -26,32 +56,72 @@ def generate_ir_from_text(description: str, deck_state=None) -> IRJob:
         description: The user's task description in plain English.
         deck_state: Optional map of labware present on the deck.  If
             provided, the resulting IR job is validated against this
-            state using :func:`preflight_check`.  Invalid plans
-            trigger a repair loop.
+            state using :func:`preflight_check`.
 
     Returns:
-        A validated IRJob.  If the repair loop fails to produce a
-        valid plan within the allowed attempts, a ValueError is raised.
+        A validated IRJob.
+
+    Raises:
+        ValueError: If the plan fails validation.  No repair is attempted
+            yet; see :func:`repair_ir_job`.
+
+    Successful plans are cached by description and deck labware, so
+    repeated requests return a copy of the earlier plan without calling
+    the planner.  Concurrent calls for a plan that is not cached yet are
+    coalesced: only the first performs planning and the others block
+    until it finishes, receiving the same result or exception.  Failed
+    plans are not cached.
 
     TODO: Replace the call to :func:`plan_from_text` with a call to
     an actual LLM and incorporate tool calling instructions.  Provide
     context on robot capabilities and labware definitions to improve
     plan quality.
     """
+    key = _request_key(description, deck_state)
+    with _INFLIGHT_LOCK:
+        cached = _PLAN_CACHE.get(key)
+        if cached is not None:
+            _PLAN_CACHE.move_to_end(key)
+            future = None
+            owner = False
+        else:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = _INFLIGHT[key] = Future()
+    if cached is not None:
+        return copy.deepcopy(cached)
+    if not owner:
+        return copy.deepcopy(future.result())
+    try:
+        ir_job = _plan_and_validate(description, deck_state)
+    except BaseException as exc:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+        future.set_exception(exc)
+        raise
+    with _INFLIGHT_LOCK:
+        del _INFLIGHT[key]
+        _PLAN_CACHE[key] = ir_job
+        if len(_PLAN_CACHE) > _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+    future.set_result(ir_job)
+    return copy.deepcopy(ir_job)
+
+
+def _plan_and_validate(description: str, deck_state) -> IRJob:
+    """Plan a job from text and validate it against ``deck_state``."""
     # Initial plan using the stub
     ir_job = plan_from_text(description)
     if deck_state is None:
         return ir_job
-    # Validate and repair if necessary
-    for attempt in range(3):
-        errors = preflight_check(ir_job, deck_state)
-        if not errors:
-            return ir_job
-        # For now, just raise after first failure – real implementation
-        # would feed error messages back to the LLM and retry
-        error_msgs = [f"{sid}: {err.name} – {msg}" for sid, err, msg in errors]
-        raise ValueError("IR generation failed: " + "; ".join(error_msgs))
-    raise ValueError("Unable to generate a valid IR plan after multiple attempts")
+    errors = preflight_check(ir_job, deck_state)
+    if errors:
+        # TODO: Once an LLM backend exists, pass ``errors`` to
+        # :func:`repair_ir_job` and retry a bounded number of times with
+        # jittered exponential backoff before giving up.
+        raise ValueError("IR generation failed: " + "; ".join(format_preflight_errors(errors)))
+    return ir_job
 
 
 def repair_ir_job(ir_job: IRJob, errors: List[Tuple[str, ErrorType, str]], description: str) -> IRJob:
@@ -12,10 +12,19 @@ schema.  Refer to the design in phase 3 for error repair loops and
 tool‑calling patterns.
 """
 
+import hashlib
 import re
+import sys
 from typing import Tuple
 from .ir import IRJob, IRStep
 
+# Example pattern: "transfer 50 uL from plate S1 A1 to plate D1 B1"
+_TRANSFER_RE = re.compile(r"transfer\s+(\d+(?:\.\d+)?)\s*u?l\s+from\s+plate\s+(\w+)\s+(\w+)\s+to\s+plate\s+(\w+)\s+(\w+)", re.IGNORECASE)
+# Wash and decontamination requests, detected in a single scan.  This is
+# kept separate from the transfer pattern so that keywords inside a
+# transfer phrase (e.g. a plate named "Wash1") still count.
+_WASH_DECON_RE = re.compile(r"(wash|decontaminat)", re.IGNORECASE)
+
 
 def plan_from_text(task_description: str) -> IRJob:
     """Convert a task description into a simple IRJob.
@@ -23,6 +32,9 @@ def plan_from_text(task_description: str) -> IRJob:
     Supports phrases like "transfer X uL from Plate S1 A1 to Plate D1 B1",
     "wash", and "decontaminate".  Unknown phrases are ignored.
 
+    Repeated planning requests are cached one layer up, by
+    :func:`~fluent_llm.llm_integration.generate_ir_from_text`.
+
     Args:
         task_description: The natural language description from the user.
 
@@ -31,14 +43,14 @@ def plan_from_text(task_description: str) -> IRJob:
         generated automatically.
     """
     steps = []
-    # Example pattern: "transfer 50 uL from plate S1 A1 to plate D1 B1"
-    transfer_pattern = re.compile(r"transfer\s+(\d+(?:\.\d+)?)\s*u?l\s+from\s+plate\s+(\w+)\s+(\w+)\s+to\s+plate\s+(\w+)\s+(\w+)", re.IGNORECASE)
-    for match in transfer_pattern.finditer(task_description):
+    for match in _TRANSFER_RE.finditer(task_description):
         vol = float(match.group(1))
-        src_labware = match.group(2)
-        src_well = match.group(3)
-        dest_labware = match.group(4)
-        dest_well = match.group(5)
+        # Labware labels and wells repeat across steps; intern them so all
+        # steps share one string object per name.
+        src_labware = sys.intern(match.group(2))
+        src_well = sys.intern(match.group(3))
+        dest_labware = sys.intern(match.group(4))
+        dest_well = sys.intern(match.group(5))
         step_id = f"s{len(steps)+1}"
         steps.append(IRStep(
             id=step_id,
@@ -52,14 +64,19 @@ def plan_from_text(task_description: str) -> IRJob:
             },
             preconditions=["robot.homed == true", "tip.attached == true"]
         ))
+    # Keywords present, e.g. {"wash", "decon"}.  Transfers keep their
+    # textual order; wash and decontamination are appended after them.
+    keywords = {match.group(1).lower()[:5] for match in _WASH_DECON_RE.finditer(task_description)}
     # Detect wash
-    if re.search(r"wash", task_description, re.IGNORECASE):
+    if "wash" in keywords:
         step_id = f"s{len(steps)+1}"
         steps.append(IRStep(id=step_id, op="wash", args={"scheme": 1}, preconditions=["robot.homed == true"]))
     # Detect decontaminate
-    if re.search(r"decontaminat", task_description, re.IGNORECASE):
+    if "decon" in keywords:
         step_id = f"s{len(steps)+1}"
         steps.append(IRStep(id=step_id, op="decontaminate", args={}, preconditions=["robot.homed == true"]))
     # Build IRJob
-    job_id = "job" + str(abs(hash(task_description)) % 100000)
+    # A content hash is stable across processes, unlike the randomized str
+    # hash, and 40 bits keep collisions between descriptions unlikely.
+    job_id = "job" + hashlib.blake2b(task_description.encode("utf-8"), digest_size=5).hexdigest()
     return IRJob(version="1.0", job_id=job_id, name=task_description, steps=steps, constraints={"require_homed": True})
\ No newline at end of file
@@ -24,7 +24,7 @@ with external risk engines.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterable, List
 
 from .ir import IRStep
 
@@ -36,6 +36,13 @@ RISK_POLICY: Dict[str, str] = {
     # Unknown operations are blocked by default
 }
 
+# Integer risk codes used by :func:`classify_steps`.
+ALLOW = 0
+CONFIRM = 1
+BLOCK = 2
+
+_RISK_CODES: Dict[str, int] = {"allow": ALLOW, "confirm": CONFIRM, "block": BLOCK}
+
 
 def classify_step(step: IRStep) -> str:
     """Return the risk classification for a given IR step.
@@ -62,3 +69,24 @@ def is_allowed(step: IRStep) -> bool:
     execute.
     """
     return classify_step(step) == "allow"
+
+
+def classify_steps(ops: Iterable[str]) -> List[int]:
+    """Classify many operations at once as integer risk codes.
+
+    Args:
+        ops: Operation names, e.g. ``[step.op for step in job.steps]`` or
+            the ``"op"`` column of :meth:`IRJob.as_columns`.
+
+    Returns:
+        One of :data:`ALLOW`, :data:`CONFIRM` or :data:`BLOCK` per
+        operation, in order.  ``code == ALLOW`` corresponds to
+        :func:`is_allowed`.
+
+    The operation‑to‑code table is built from ``RISK_POLICY`` once per
+    call, so each operation then costs a single dict lookup while later
+    edits to ``RISK_POLICY`` are still honoured.
+    """
+    codes = {op: _RISK_CODES.get(level, BLOCK) for op, level in RISK_POLICY.items()}
+    lookup = codes.get
+    return [lookup(op, BLOCK) for op in ops]
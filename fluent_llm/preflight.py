@@ -8,13 +8,214 @@ production use, extend the validator to inspect the actual deck setup
 and enforce all safety policies defined in phase 3.
 """
 
-from typing import Dict, List, Tuple
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
 from .ir import IRJob, IRStep
-from .capabilities import get_liquid_class_precedence
+from .capabilities import get_capabilities, get_liquid_class_precedence
 from .state import ErrorType
 
 
-def preflight_check(job: IRJob, deck_state: Dict[str, any], max_volume_uL: float = 1000.0) -> List[Tuple[str, ErrorType, str]]:
+class PreflightError:
+    """A single validation failure, usable as a ``(step_id, error_type, message)`` tuple.
+
+    The human readable message is only formatted when it is accessed, so
+    callers that just inspect the error type (or a job with many failing
+    steps that is rejected wholesale) never pay for string formatting.
+    Instances unpack, index and compare like the plain tuples returned
+    by earlier versions::
+
+        step_id, error_type, message = error
+
+    Attributes:
+        step_id: ID of the offending step.
+        error_type: The :class:`ErrorType` of the failure.
+    """
+
+    __slots__ = ("step_id", "error_type", "_template", "_args")
+
+    def __init__(self, step_id: str, error_type: ErrorType, template: str, *args: Any) -> None:
+        self.step_id = step_id
+        self.error_type = error_type
+        self._template = template
+        self._args = args
+
+    @property
+    def message(self) -> str:
+        """The formatted error message."""
+        return self._template % self._args
+
+    def _as_tuple(self) -> Tuple[str, ErrorType, str]:
+        return (self.step_id, self.error_type, self.message)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._as_tuple())
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: Any) -> Any:
+        if index == 0:
+            return self.step_id
+        if index == 1:
+            return self.error_type
+        return self._as_tuple()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PreflightError):
+            other = other._as_tuple()
+        if isinstance(other, tuple):
+            return self._as_tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._as_tuple())
+
+    def __repr__(self) -> str:
+        return repr(self._as_tuple())
+
+
+PreflightErrors = List[PreflightError]
+
+# A validator checks one step of a known operation against the deck state
+# and returns the errors found (an empty tuple if none).
+Validator = Callable[[IRStep, Mapping[str, Any]], Any]
+
+# Internally each operation's validator checks a run of consecutive steps
+# with that operation, so a job costs one call per run rather than per step.
+_RunValidator = Callable[[Iterable[IRStep], Mapping[str, Any]], Any]
+
+# Validators specialised for the current capability registry, keyed by
+# ``max_volume_uL``.  Each entry remembers the registry it was built from;
+# ``get_capabilities`` returns a new object when the YAML file changes,
+# which triggers a rebuild.
+_VALIDATOR_CACHE: Dict[float, Tuple[Mapping[str, Any], Dict[str, _RunValidator]]] = {}
+
+_NO_ERRORS = ()
+
+_op_of = attrgetter("op")
+
+# Default per‑operation volume ceiling for :func:`preflight_check`
+_DEFAULT_MAX_VOLUME_UL = 1000.0
+
+
+def _section(mapping: Any, key: str) -> Mapping[str, Any]:
+    """Return ``mapping[key]`` if it is a mapping, else an empty dict."""
+    value = mapping.get(key) if isinstance(mapping, Mapping) else None
+    return value if isinstance(value, Mapping) else {}
+
+
+def _build_validators(registry: Mapping[str, Any], max_volume_uL: float) -> Dict[str, _RunValidator]:
+    """Build one validator per supported operation from the registry.
+
+    Schema lookups (volume limits, wash schemes) happen once here and are
+    bound into the closures, so validating a step only performs direct
+    comparisons.  The registry's volume constraints tighten the limits:
+    the minimum volume defaults to "greater than zero" and the maximum is
+    the smaller of ``max_volume_uL`` and the registry maximum.
+    """
+    volume_limits = _section(_section(registry, "constraints"), "volume")
+    vmin = volume_limits.get("min", 0.0)
+    vmax = min(max_volume_uL, volume_limits.get("max", max_volume_uL))
+    schemes = _section(_section(registry, "capabilities"), "wash").get("schemes")
+
+    def validate_transfers(steps: Iterable[IRStep], deck_state: Mapping[str, Any], _vmin=vmin, _vmax=vmax):
+        errors = _NO_ERRORS
+        for step in steps:
+            args = step.args
+            src_labware = args.get("source_labware")
+            dest_labware = args.get("dest_labware")
+            volume = args.get("volume_uL")
+            volume_ok = volume is not None and volume > 0 and _vmin <= volume <= _vmax
+            # Clean steps keep the shared empty result; a list is only
+            # allocated once a step fails
+            if volume_ok and src_labware in deck_state and dest_labware in deck_state:
+                continue
+            if not errors:
+                errors = []
+            if src_labware not in deck_state:
+                errors.append(PreflightError(step.id, ErrorType.LABWARE_NOT_FOUND, "Source labware %s missing", src_labware))
+            if dest_labware not in deck_state:
+                errors.append(PreflightError(step.id, ErrorType.LABWARE_NOT_FOUND, "Destination labware %s missing", dest_labware))
+            if not volume_ok:
+                errors.append(PreflightError(step.id, ErrorType.VOLUME_OUT_OF_RANGE, "Volume %sµL invalid", volume))
+        return errors
+
+    def validate_washes(steps: Iterable[IRStep], deck_state: Mapping[str, Any], _schemes=frozenset(schemes or ())):
+        errors = _NO_ERRORS
+        for step in steps:
+            scheme = step.args.get("scheme", 1)
+            try:
+                supported = scheme in _schemes
+            except TypeError:
+                # Unhashable values such as lists are never a known scheme
+                supported = False
+            if not supported:
+                if not errors:
+                    errors = []
+                errors.append(PreflightError(step.id, ErrorType.INVALID_ARGUMENT, "Wash scheme %s not supported", scheme))
+        return errors
+
+    def no_checks(steps: Iterable[IRStep], deck_state: Mapping[str, Any]):
+        # Decontamination has no mandatory arguments
+        return _NO_ERRORS
+
+    return {
+        "transfer": validate_transfers,
+        # Without a list of schemes in the registry, any scheme is accepted
+        "wash": validate_washes if schemes else no_checks,
+        "decontaminate": no_checks,
+    }
+
+
+def _get_validators(max_volume_uL: float) -> Dict[str, _RunValidator]:
+    """Return validators for the current registry, rebuilding if it changed."""
+    registry = get_capabilities()
+    cached = _VALIDATOR_CACHE.get(max_volume_uL)
+    if cached is not None and cached[0] is registry:
+        return cached[1]
+    validators = _build_validators(registry, max_volume_uL)
+    _VALIDATOR_CACHE[max_volume_uL] = (registry, validators)
+    return validators
+
+
+def get_step_validator(max_volume_uL: float = _DEFAULT_MAX_VOLUME_UL) -> Validator:
+    """Return a function that validates a single step.
+
+    The returned callable takes ``(step, deck_state)`` and returns the
+    step's :class:`PreflightError` entries (empty if it passes), applying
+    exactly the checks of :func:`preflight_check`.  It is bound to the
+    capability registry loaded at call time, so callers validating steps
+    one by one (e.g. while executing a job) should fetch it once per job.
+    """
+    validators = _get_validators(max_volume_uL)
+
+    def validate_step(step: IRStep, deck_state: Mapping[str, Any]):
+        validator = validators.get(step.op)
+        # Unknown operation check
+        if validator is None:
+            return [PreflightError(step.id, ErrorType.UNKNOWN_OPERATION, "Unknown op: %s", step.op)]
+        return validator((step,), deck_state)
+
+    return validate_step
+
+
+def format_preflight_errors(errors: PreflightErrors, prefix: str = "") -> List[str]:
+    """Render preflight errors as ``"<prefix><step_id>: <ERROR> – <message>"`` lines.
+
+    Args:
+        errors: Errors returned by :func:`preflight_check`.
+        prefix: Prepended to each step ID, e.g. ``"job1/"`` when errors
+            from several jobs are reported together.
+    """
+    return [f"{prefix}{step_id}: {error.name} – {msg}" for step_id, error, msg in errors]
+
+
+def preflight_check(
+    job: IRJob,
+    deck_state: Dict[str, any],
+    max_volume_uL: float = _DEFAULT_MAX_VOLUME_UL,
+) -> PreflightErrors:
     """Validate an IR job against simple criteria.
 
     Args:
@@ -23,10 +224,12 @@ def preflight_check(job: IRJob, deck_state: Dict[str, any], max_volume_uL: float
             capacities).  For this prototype, deck_state is assumed to be a
             dictionary of present labware labels.
         max_volume_uL: Maximum volume in microliters allowed per aspirate or
-            dispense.
+            dispense.  The volume limits in ``capabilities.yaml`` are
+            applied as well.
 
     Returns:
-        A list of tuples (step_id, error_type, message) for each validation
+        A list of :class:`PreflightError` entries, which behave like
+        ``(step_id, error_type, message)`` tuples, one per validation
         failure detected.  An empty list means the job passed validation.
 
     TODO: Incorporate detailed labware dimensions, tip capacities, and
@@ -35,7 +238,7 @@ def preflight_check(job: IRJob, deck_state: Dict[str, any], max_volume_uL: float
     preflight options described in the knowledge portal【654457521633302†L112-L124】.
     """
 
-    errors: List[Tuple[str, ErrorType, str]] = []
+    errors: PreflightErrors = []
     # Load liquid class precedence rules.  In the current prototype these
     # rules are not actively enforced, but the call ensures that
     # precedence configuration can be consulted in future checks.  For
@@ -43,23 +246,16 @@ def preflight_check(job: IRJob, deck_state: Dict[str, any], max_volume_uL: float
     # classes with worklist‑defined ones and warn if precedence would
     # override them.  See liquid_class_precedence.yaml for details.
     _precedence = get_liquid_class_precedence()
-    for step in job.steps:
+    # Validate each run of consecutive same-op steps with one call to that
+    # operation's validator; errors stay in step order
+    get_validator = _get_validators(max_volume_uL).get
+    for op, run in groupby(job.steps, key=_op_of):
+        validator = get_validator(op)
         # Unknown operation check
-        if step.op not in {"transfer", "wash", "decontaminate"}:
-            errors.append((step.id, ErrorType.UNKNOWN_OPERATION, f"Unknown op: {step.op}"))
+        if validator is None:
+            errors.extend(PreflightError(step.id, ErrorType.UNKNOWN_OPERATION, "Unknown op: %s", op) for step in run)
             continue
-
-        # Common argument checks
-        if step.op == "transfer":
-            src_labware = step.args.get("source_labware")
-            dest_labware = step.args.get("dest_labware")
-            volume = step.args.get("volume_uL")
-            if src_labware not in deck_state:
-                errors.append((step.id, ErrorType.LABWARE_NOT_FOUND, f"Source labware {src_labware} missing"))
-            if dest_labware not in deck_state:
-                errors.append((step.id, ErrorType.LABWARE_NOT_FOUND, f"Destination labware {dest_labware} missing"))
-            if volume is None or volume <= 0 or volume > max_volume_uL:
-                errors.append((step.id, ErrorType.VOLUME_OUT_OF_RANGE, f"Volume {volume}µL invalid"))
-        # Additional checks for wash and decontaminate could verify scheme ranges
-        # or required equipment.  Currently, no arguments are mandatory.
-    return errors
\ No newline at end of file
+        run_errors = validator(run, deck_state)
+        if run_errors:
+            errors.extend(run_errors)
+    return errors
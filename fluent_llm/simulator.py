@@ -10,9 +10,144 @@ to account for constraints like minimum/maximum volumes, tip usage,
 mixing cycles and multi‑pipetting【189890760946635†L45-L100】.
 """
 
-from typing import Dict, List
-from .ir import IRJob
-from .compiler import well_to_position
+from typing import Any, Callable, Dict, Final, FrozenSet, List, Mapping, Tuple
+from .ir import IRJob, IRStep
+from .compiler import _WELL_POS, well_to_position
+
+_EMPTY_PLATE = (0.0,) * 96
+
+# Operations that do not touch labware volumes
+_NOOP_OPS: Final[FrozenSet[str]] = frozenset({"wash", "decontaminate"})
+
+# Zero‑based well indices, derived once from the compiler's position table
+_WELL_INDEX: Dict[str, int] = {well: pos - 1 for well, pos in _WELL_POS.items()}
+
+
+def _flat_index(
+    spans: Dict[str, Tuple[int, int]],
+    volumes: List[float],
+    initial: Mapping[str, List[float]],
+    labware: str,
+    well: str,
+) -> int:
+    """Return the flat buffer index of ``well`` in ``labware``.
+
+    Labware seen for the first time is copied from ``initial`` to the end
+    of ``volumes``, or allocated as an empty 96‑well plate if it has no
+    initial volumes.
+
+    Raises:
+        KeyError: If ``labware`` is empty or ``None``.
+        IndexError: If the well lies beyond the volumes provided for the
+            labware (e.g. a short list in ``initial_state``).
+    """
+    span = spans.get(labware)
+    if span is None:
+        if not labware:
+            raise KeyError(labware)
+        start_volumes = initial.get(labware, _EMPTY_PLATE)
+        span = spans[labware] = (len(volumes), len(start_volumes))
+        volumes.extend(start_volumes)
+    start, size = span
+    index = _WELL_INDEX.get(well)
+    if index is None:
+        index = well_to_position(well) - 1
+    if index >= size:
+        raise IndexError(f"Well {well} out of range for labware {labware}")
+    return start + index
+
+
+def _build_state(
+    spans: Dict[str, Tuple[int, int]],
+    volumes: List[float],
+    initial: Mapping[str, List[float]],
+) -> Dict[str, List[float]]:
+    """Split the flat buffer back into per‑labware volume lists.
+
+    Labware from ``initial`` comes first, in its original order; entries
+    never copied into the buffer are returned as fresh copies.
+    """
+    state: Dict[str, List[float]] = {}
+    for labware, start_volumes in initial.items():
+        span = spans.get(labware)
+        state[labware] = list(start_volumes) if span is None else volumes[span[0]:span[0] + span[1]]
+    for labware, (start, size) in spans.items():
+        if labware not in state:
+            state[labware] = volumes[start:start + size]
+    return state
+
+
+def _simulate_transfer(
+    spans: Dict[str, Tuple[int, int]],
+    volumes: List[float],
+    initial: Mapping[str, List[float]],
+    args: Mapping[str, Any],
+) -> None:
+    """Move ``volume_uL`` from the source well to the destination well."""
+    src_index = _flat_index(spans, volumes, initial, args["source_labware"], args["source_well"])
+    dest_index = _flat_index(spans, volumes, initial, args["dest_labware"], args["dest_well"])
+    vol = args["volume_uL"]
+    volumes[src_index] -= vol
+    volumes[dest_index] += vol
+
+
+def _simulate_noop(
+    spans: Dict[str, Tuple[int, int]],
+    volumes: List[float],
+    initial: Mapping[str, List[float]],
+    args: Mapping[str, Any],
+) -> None:
+    """Placeholder for operations that do not change volumes."""
+
+
+# Volume update per IR operation.  Each handler applies one step's
+# arguments to the flat volume buffer.  Operations without an entry are
+# ignored, like the no‑op ones; register new operations (aspirate,
+# dispense, mix, ...) here.
+_OpHandler = Callable[[Dict[str, Tuple[int, int]], List[float], Mapping[str, List[float]], Mapping[str, Any]], None]
+
+_OP_HANDLERS: Dict[str, _OpHandler] = {
+    "transfer": _simulate_transfer,
+    **dict.fromkeys(_NOOP_OPS, _simulate_noop),
+}
+
+
+class Simulation:
+    """Incremental volume simulation, one step at a time.
+
+    :func:`simulate_ir` runs a whole job through a ``Simulation``; use the
+    class directly when steps are processed individually, e.g. alongside
+    validation.  Volumes for all labware live in one flat buffer where
+    each labware owns a contiguous run of slots (96 for plates created
+    here).  Labware from ``initial_state`` is only copied into the buffer
+    when a transfer first touches it.
+
+    Args:
+        initial_state: Optional initial volumes per labware, as for
+            :func:`simulate_ir`.  It is never modified.
+    """
+
+    __slots__ = ("_spans", "_volumes", "_initial")
+
+    def __init__(self, initial_state: Mapping[str, List[float]] = None) -> None:
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._volumes: List[float] = []
+        self._initial: Mapping[str, List[float]] = initial_state if initial_state is not None else {}
+
+    def apply(self, step: IRStep) -> None:
+        """Apply one step through its handler in ``_OP_HANDLERS``.
+
+        Operations without a handler do not change volumes.
+
+        Raises:
+            KeyError: If a transfer lacks a required argument.
+            IndexError, ValueError: If a well ID is invalid for its labware.
+        """
+        _OP_HANDLERS.get(step.op, _simulate_noop)(self._spans, self._volumes, self._initial, step.args)
+
+    def state(self) -> Dict[str, List[float]]:
+        """Return the current volumes, in the order described by :func:`simulate_ir`."""
+        return _build_state(self._spans, self._volumes, self._initial)
 
 
 def simulate_ir(job: IRJob, initial_state: Dict[str, List[float]] = None) -> Dict[str, List[float]]:
@@ -26,6 +161,9 @@ def simulate_ir(job: IRJob, initial_state: Dict[str, List[float]] = None) -> Dic
 
     Returns:
         A state dictionary mapping labware labels to updated volumes.
+        Labware from ``initial_state`` comes first, in its original order,
+        followed by labware first referenced by the job.  All volume
+        lists are new; ``initial_state`` is never modified or shared.
 
     Notes:
         This simulation assumes all wells can hold unlimited volume and does
@@ -33,38 +171,7 @@ def simulate_ir(job: IRJob, initial_state: Dict[str, List[float]] = None) -> Dic
         maximum capacity (e.g. 250 µL for a 96‑well plate)【189890760946635†L45-L100】.
         Use the simulator only for quick sanity checks.
     """
-    state: Dict[str, List[float]] = {}
-    # Initialize state
-    if initial_state is not None:
-        for labware, volumes in initial_state.items():
-            state[labware] = volumes.copy()
-    # Ensure all labware in job appears in state
-    for step in job.steps:
-        if step.op == "transfer":
-            for labware_key in (step.args.get("source_labware"), step.args.get("dest_labware")):
-                if labware_key and labware_key not in state:
-                    state[labware_key] = [0.0] * 96
-        elif step.op in {"wash", "decontaminate"}:
-            # wash/decontaminate does not require labware volumes
-            continue
-
-    # Simulate each step
+    simulation = Simulation(initial_state)
     for step in job.steps:
-        if step.op == "transfer":
-            src_labware = step.args["source_labware"]
-            src_well = step.args["source_well"]
-            dest_labware = step.args["dest_labware"]
-            dest_well = step.args["dest_well"]
-            vol = step.args["volume_uL"]
-            src_index = well_to_position(src_well) - 1
-            dest_index = well_to_position(dest_well) - 1
-            # Deduct volume from source and add to destination
-            state[src_labware][src_index] -= vol
-            state[dest_labware][dest_index] += vol
-        elif step.op == "wash":
-            # Placeholder: no state changes
-            pass
-        elif step.op == "decontaminate":
-            # Placeholder: no state changes
-            pass
-    return state
\ No newline at end of file
+        simulation.apply(step)
+    return simulation.state()
@@ -6,9 +6,13 @@ the error codes and warnings documented in the FluentControl software
 manual【654457521633302†L112-L124】.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
+
+# ``slots`` is only accepted by ``dataclass`` from Python 3.10 onwards.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ErrorType(Enum):
@@ -26,6 +30,7 @@ class ErrorType(Enum):
     MOTION_ERROR = "motion_error"
     UNKNOWN_OPERATION = "unknown_operation"
     PRECONDITION_FAILED = "precondition_failed"
+    INVALID_ARGUMENT = "invalid_argument"
 
 
 class RecoveryAction(Enum):
@@ -37,7 +42,27 @@ class RecoveryAction(Enum):
     REQUIRE_USER = "require_user"
 
 
-@dataclass
+class JobState(str, Enum):
+    """Lifecycle states of a job managed by the job manager.
+
+    Members are also ``str`` instances equal to their value, so
+    ``JobState.PENDING == "pending"`` and statuses serialize as plain
+    strings.  Allowed transitions are defined in ``job_manager``.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+    ERROR = "error"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Slotted where supported; event timelines can grow long
+@dataclass(**_DATACLASS_OPTIONS)
 class RobotEvent:
     """Represents a single event in the robot's execution timeline."""
     state: str
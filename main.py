@@ -14,20 +14,25 @@ Run this script directly to see a demonstration.  In a real system,
 natural language input would be provided by users or other applications.
 """
 
+import sys
+
 from fluent_llm import plan_from_text, JobManager
 
 
 def main():
+    # Output is collected in ``out`` and written with a single
+    # ``sys.stdout.write`` rather than one ``print`` call per line, which
+    # matters when the worklist is long and stdout is a pipe or file.
+    out = []
     # Example task description.  You can modify this string to test
     # other phrases supported by the stub.
     description = "Transfer 50 uL from plate S1 A1 to plate D1 B1, wash, then decontaminate."
-    print(f"Task description: {description}\n")
+    out.append(f"Task description: {description}\n")
     # Step 1: LLM planning (stubbed)
     job = plan_from_text(description)
-    print("Generated IR job:")
-    for step in job.steps:
-        print(f"  {step.id} – op={step.op}, args={step.args}")
-    print()
+    out.append("Generated IR job:")
+    out.extend(f"  {step.id} – op={step.op}, args={step.args}" for step in job.steps)
+    out.append("")
     # Step 2: Set up deck_state.  In a real system this would be read
     # from the robot's deck configuration.  Here we assume S1 and D1 are present.
     deck_state = {"S1": {}, "D1": {}}
@@ -36,19 +41,21 @@ def main():
     try:
         manager.submit(job)
     except ValueError as e:
-        print("Preflight validation failed:")
-        print(e)
+        out.append("Preflight validation failed:")
+        out.append(str(e))
+        sys.stdout.write("\n".join(out) + "\n")
         return
     # Step 4: Compile and simulate
     worklist, sim_state = manager.run_next()
-    print("Compiled worklist lines:\n")
-    for line in worklist:
-        print(line)
-    print("\nSimulation state (delta volumes):")
-    for labware, volumes in sim_state.items():
-        # Print total volume per labware for brevity
-        total_vol = sum(volumes)
-        print(f"  {labware}: total volume = {total_vol} µL")
+    out.append("Compiled worklist lines:\n")
+    out.extend(worklist)
+    out.append("\nSimulation state (delta volumes):")
+    # Print total volume per labware for brevity
+    out.extend(
+        f"  {labware}: total volume = {sum(volumes)} µL"
+        for labware, volumes in sim_state.items()
+    )
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,4 +3,21 @@
 This package contains unit tests for the components of the
 ``fluent_llm`` module.  Use ``python -m unittest discover`` from the
 project root to run all tests.
-"""
\ No newline at end of file
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keep the capability pickle cache out of the user's real cache directory
+# while the suite runs.  ``unittest discover`` may import ``fluent_llm``
+# before this package, and tests reload the capabilities module, so set
+# both the environment variable and the already-resolved directory.
+_CACHE_HOME = tempfile.mkdtemp(prefix="fluent_llm-tests-")
+atexit.register(shutil.rmtree, _CACHE_HOME, True)
+os.environ["XDG_CACHE_HOME"] = _CACHE_HOME
+
+from fluent_llm import capabilities as _capabilities  # noqa: E402
+
+_capabilities._PICKLE_CACHE_DIR = os.path.join(_CACHE_HOME, "fluent_llm")
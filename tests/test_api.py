@@ -5,6 +5,7 @@ correctly and exposes state and capabilities.  Because the API is a
 thin wrapper, the tests focus on return values and state changes.
 """
 
+import json
 import unittest
 
 from fluent_llm.ir import IRJob, IRStep
@@ -54,6 +55,10 @@ class TestRobotAPI(unittest.TestCase):
         # Capabilities registry should contain 'capabilities'
         caps = self.api.list_capabilities()
         self.assertIn("capabilities", caps)
+        # The endpoint hands out a plain copy that serializes and can be edited
+        self.assertEqual(json.loads(json.dumps(caps)), caps)
+        caps["capabilities"].clear()
+        self.assertIn("aspirate", self.api.list_capabilities()["capabilities"])
 
 
 if __name__ == "__main__":
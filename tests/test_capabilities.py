@@ -6,16 +6,21 @@ expected top‑level keys.  If the file is missing or invalid, the
 loader should return an empty dictionary.
 """
 
+import os
+import tempfile
 import unittest
+from collections.abc import Mapping
+from unittest import mock
 
-from fluent_llm.capabilities import get_capabilities
+from fluent_llm import capabilities as capabilities_module
+from fluent_llm.capabilities import _load_yaml_cached, _parse_yaml, get_capabilities, get_liquid_class_precedence
 
 
 class TestCapabilities(unittest.TestCase):
     def test_load_capabilities(self):
         data = get_capabilities()
-        # The registry should be a dict with 'capabilities' and 'constraints'
-        self.assertIsInstance(data, dict)
+        # The registry should be a mapping with 'capabilities' and 'constraints'
+        self.assertIsInstance(data, Mapping)
         # If the YAML file is present, both keys should be present
         # Since a placeholder file is provided, we check for them.
         self.assertIn("capabilities", data)
@@ -28,6 +33,46 @@ class TestCapabilities(unittest.TestCase):
         self.assertIn("min", volume_constraints)
         self.assertIn("max", volume_constraints)
 
+    def test_cached_registry_is_shared_and_read_only(self):
+        first = get_capabilities()
+        # Repeated calls reuse the same parsed instance
+        self.assertIs(get_capabilities(), first)
+        with self.assertRaises(TypeError):
+            first["capabilities"] = {}  # type: ignore[index]
+
+    def test_liquid_class_precedence_is_memoized(self):
+        precedence = get_liquid_class_precedence()
+        self.assertEqual(precedence["advanced_worklist"], "worklist")
+        self.assertIs(get_liquid_class_precedence(), precedence)
+
+    def test_cache_invalidated_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(capabilities_module, "_PICKLE_CACHE_DIR", tmp):
+            path = os.path.join(tmp, "registry.yaml")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("value: 1\n")
+            self.assertEqual(_load_yaml_cached(path)["value"], 1)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("value: 22\n")
+            # Force a distinct mtime in case the filesystem clock is coarse
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(_load_yaml_cached(path)["value"], 22)
+
+    def test_parse_reuses_pickle_cache(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(capabilities_module, "_PICKLE_CACHE_DIR", os.path.join(tmp, "cache")):
+            path = os.path.join(tmp, "registry.yaml")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("value: [1, 2]\n")
+            st = os.stat(path)
+            self.assertEqual(_parse_yaml(path, st), {"value": [1, 2]})
+            self.assertEqual(len([f for f in os.listdir(os.path.join(tmp, "cache")) if f.endswith(".pkl")]), 1)
+            # A second parse of the unchanged file must not touch the YAML loader
+            with mock.patch.object(capabilities_module.yaml, "load") as load:
+                self.assertEqual(_parse_yaml(path, st), {"value": [1, 2]})
+            load.assert_not_called()
+
     def test_no_yaml_returns_empty(self):
         # Temporarily rename the YAML file to simulate it missing
         import os
@@ -41,9 +86,13 @@ class TestCapabilities(unittest.TestCase):
             from fluent_llm import capabilities  # type: ignore
             import importlib as _importlib
             _importlib.reload(capabilities)
-            # Without the YAML, get_capabilities should return {}
+            # Without the YAML, get_capabilities should return an empty
+            # read-only mapping, like a loaded registry
             data = capabilities.get_capabilities()
             self.assertEqual(data, {})
+            self.assertIs(capabilities.get_capabilities(), data)
+            with self.assertRaises(TypeError):
+                data["capabilities"] = {}  # type: ignore[index]
         finally:
             # Restore the YAML file
             os.rename(backup_path, path)
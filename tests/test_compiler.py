@@ -1,9 +1,11 @@
 """Unit tests for the compiler module."""
 
+import os
+import tempfile
 import unittest
 
 from fluent_llm.ir import IRJob, IRStep
-from fluent_llm.compiler import compile_ir, well_to_position
+from fluent_llm.compiler import compile_ir, iter_compile_ir, well_to_position, wells_to_positions, write_worklist
 
 
 class TestCompiler(unittest.TestCase):
@@ -12,6 +14,19 @@ class TestCompiler(unittest.TestCase):
         self.assertEqual(well_to_position("A1"), 1)
         self.assertEqual(well_to_position("A2"), 9)
         self.assertEqual(well_to_position("H12"), 96)
+        # Lower‑case and zero‑padded IDs are accepted
+        self.assertEqual(well_to_position("b1"), 2)
+        self.assertEqual(well_to_position("A02"), 9)
+
+    def test_wells_to_positions(self):
+        self.assertEqual(wells_to_positions(["A1", "h12", "B01"]), [1, 96, 2])
+        with self.assertRaises(ValueError):
+            wells_to_positions(["A1", "Z9"])
+
+    def test_well_to_position_invalid(self):
+        for well in ("I1", "A0", "A13"):
+            with self.assertRaises(ValueError):
+                well_to_position(well)
 
     def test_compile_transfer(self):
         job = IRJob(
@@ -49,6 +64,54 @@ class TestCompiler(unittest.TestCase):
         lines = compile_ir(job)
         self.assertEqual(lines, ["W3;", "WD;"])
 
+    def test_transfer_only_job_matches_mixed_job_output(self):
+        transfers = [
+            IRStep(id=f"s{i}", op="transfer", args={
+                "source_labware": "S1",
+                "source_well": well,
+                "dest_labware": "D1",
+                "dest_well": "H12",
+                "volume_uL": 5.5,
+                "liquid_class": "Serum" if i % 2 else None,
+                "worklist_liquid_class": "DMSO" if i == 2 else None,
+            })
+            for i, well in enumerate(("A1", "b2", "C03"))
+        ]
+        transfer_only = compile_ir(IRJob(version="1.0", job_id="t", steps=transfers))
+        mixed = compile_ir(IRJob(version="1.0", job_id="m", steps=transfers + [
+            IRStep(id="w", op="wash", args={}),
+        ]))
+        self.assertEqual(transfer_only, mixed[:-1])
+        self.assertEqual(transfer_only[0], "A;S1;;;1;;5.50;Water;;;")
+        self.assertEqual(transfer_only[3], "D;D1;;;96;;5.50;Serum;;;")
+        self.assertEqual(transfer_only[4], "A;S1;;;19;;5.50;DMSO;;;")
+
+    def test_transfer_missing_argument(self):
+        job = IRJob(version="1.0", job_id="bad", steps=[
+            IRStep(id="s1", op="transfer", args={"source_labware": "S1"}),
+        ])
+        with self.assertRaisesRegex(ValueError, "step s1"):
+            compile_ir(job)
+
+    def test_iter_compile_matches_compile_and_writes_file(self):
+        job = IRJob(version="1.0", job_id="stream", steps=[
+            IRStep(id="s1", op="transfer", args={
+                "source_labware": "S1",
+                "source_well": "A1",
+                "dest_labware": "D1",
+                "dest_well": "B1",
+                "volume_uL": 10.0,
+            }),
+            IRStep(id="s2", op="wash", args={"scheme": 2}),
+        ])
+        expected = compile_ir(job)
+        self.assertEqual(list(iter_compile_ir(job)), expected)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "job.gwl")
+            self.assertEqual(write_worklist(job, path), len(expected))
+            with open(path, encoding="utf-8") as fh:
+                self.assertEqual(fh.read().splitlines(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
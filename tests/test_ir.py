@@ -0,0 +1,57 @@
+"""Unit tests for the IR dataclasses."""
+
+import json
+import unittest
+from dataclasses import asdict
+
+from fluent_llm.ir import IRJob, IRStep
+
+
+class TestIR(unittest.TestCase):
+    def test_from_json_round_trips_asdict(self):
+        job = IRJob(
+            version="1.0",
+            job_id="job1",
+            name="demo",
+            steps=[
+                IRStep(id="s1", op="transfer", args={"source_labware": "S1", "volume_uL": 5.0},
+                       preconditions=["robot.homed == true"]),
+                IRStep(id="s2", op="wash", args={"scheme": 1}),
+            ],
+            constraints={"require_homed": True},
+        )
+        raw = json.dumps(asdict(job))
+        self.assertEqual(IRJob.from_json(raw), job)
+        self.assertEqual(IRJob.from_json(raw.encode("utf-8")), job)
+
+    def test_from_dict_defaults_and_errors(self):
+        job = IRJob.from_dict({"version": "1.0", "job_id": "job2", "steps": [{"id": "s1", "op": "decontaminate"}]})
+        self.assertEqual(job.steps, [IRStep(id="s1", op="decontaminate")])
+        self.assertIsNone(job.name)
+        with self.assertRaises(ValueError):
+            IRJob.from_dict({"version": "1.0", "job_id": "job3", "steps": [{"id": "s1"}]})
+        with self.assertRaises(ValueError):
+            IRJob.from_json("{not json")
+
+    def test_from_json_rejects_malformed_shapes(self):
+        cases = [
+            "[]",
+            '{"version": "1.0", "job_id": "j", "steps": null}',
+            '{"version": "1.0", "job_id": "j", "steps": ["x"]}',
+            '{"version": "1.0", "job_id": "j", "steps": [{"id": "s1", "op": "wash", "args": null}]}',
+            '{"version": "1.0", "job_id": "j", "steps": [{"id": "s1", "op": "wash", "preconditions": "x"}]}',
+            '{"version": "1.0", "job_id": "j", "constraints": []}',
+            '{"job_id": "j"}',
+            '{"version": 1, "job_id": "j"}',
+            '{"version": "1.0", "job_id": ["j"]}',
+            '{"version": "1.0", "job_id": "j", "name": 5}',
+            '{"version": "1.0", "job_id": "j", "steps": [{"id": 1, "op": "wash"}]}',
+            '{"version": "1.0", "job_id": "j", "steps": [{"id": "s1", "op": ["transfer"]}]}',
+        ]
+        for raw in cases:
+            with self.subTest(raw=raw), self.assertRaises(ValueError):
+                IRJob.from_json(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
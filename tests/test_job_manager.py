@@ -0,0 +1,182 @@
+"""Unit tests for the JobManager orchestrator."""
+
+import json
+import unittest
+
+from fluent_llm.compiler import compile_ir
+from fluent_llm.ir import IRJob, IRStep
+from fluent_llm.job_manager import JobManager
+from fluent_llm.simulator import simulate_ir
+from fluent_llm.state import JobState
+
+
+def _transfer_job(job_id: str, source: str = "S1", volume: float = 10.0) -> IRJob:
+    return IRJob(
+        version="1.0",
+        job_id=job_id,
+        steps=[IRStep(id="s1", op="transfer", args={
+            "source_labware": source,
+            "source_well": "A1",
+            "dest_labware": "D1",
+            "dest_well": "B1",
+            "volume_uL": volume,
+        })],
+    )
+
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = JobManager(deck_state={"S1": {}, "D1": {}})
+
+    def test_submit_many_enqueues_in_order(self):
+        ids = self.manager.submit_many([_transfer_job("j1"), _transfer_job("j2")])
+        self.assertEqual(ids, ["j1", "j2"])
+        self.assertEqual(self.manager.status("j1"), "pending")
+        self.assertEqual(self.manager.status("j2"), "pending")
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("j1"), "completed")
+        self.assertEqual(self.manager.status("j2"), "pending")
+
+    def test_submit_many_is_atomic(self):
+        jobs = [_transfer_job("j1"), _transfer_job("j2", source="X1")]
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.submit_many(jobs)
+        self.assertIn("j2/s1", str(ctx.exception))
+        # Nothing from the batch should have been enqueued
+        self.assertEqual(self.manager.state["queued_jobs"], 0)
+        self.assertIsNone(self.manager.status("j1"))
+
+    def test_abort_pending_job_is_skipped(self):
+        self.manager.submit_many([_transfer_job("j1"), _transfer_job("j2")])
+        self.manager.abort("j1")
+        self.assertEqual(self.manager.status("j1"), "aborted")
+        self.assertEqual(self.manager.state["queued_jobs"], 1)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("j1"), "aborted")
+        self.assertEqual(self.manager.status("j2"), "completed")
+        with self.assertRaises(IndexError):
+            self.manager.run_next()
+
+    def test_duplicate_submission_is_not_requeued(self):
+        self.assertEqual(self.manager.submit(_transfer_job("j1")), "j1")
+        self.assertEqual(self.manager.submit(_transfer_job("j1")), "j1")
+        self.assertEqual(self.manager.submit_many([_transfer_job("j1"), _transfer_job("j2")]), ["j1", "j2"])
+        self.assertEqual(self.manager.state["queued_jobs"], 2)
+        self.manager.run_next()
+        self.manager.run_next()
+        with self.assertRaises(IndexError):
+            self.manager.run_next()
+
+    def test_finished_job_can_be_resubmitted(self):
+        self.manager.submit(_transfer_job("j1"))
+        self.manager.run_next()
+        # Re-running a completed protocol enqueues it again
+        self.assertEqual(self.manager.submit(_transfer_job("j1")), "j1")
+        self.assertEqual(self.manager.status("j1"), JobState.PENDING)
+        self.manager.abort("j1")
+        self.manager.submit(_transfer_job("j1"))
+        self.assertEqual(self.manager.state["queued_jobs"], 1)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("j1"), JobState.COMPLETED)
+        # An aborted job resubmitted as the same object goes to the back of
+        # the queue instead of reviving its old position
+        job_a = _transfer_job("a")
+        self.manager.submit(job_a)
+        self.manager.submit(_transfer_job("b"))
+        self.manager.abort("a")
+        self.manager.submit(job_a)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("b"), JobState.COMPLETED)
+        self.assertEqual(self.manager.status("a"), JobState.PENDING)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("a"), JobState.COMPLETED)
+        with self.assertRaises(IndexError):
+            self.manager.run_next()
+
+    def test_conflicting_active_job_id_is_rejected(self):
+        self.manager.submit(_transfer_job("j1"))
+        with self.assertRaises(ValueError):
+            self.manager.submit(_transfer_job("j1", volume=20.0))
+        self.assertEqual(self.manager.state["queued_jobs"], 1)
+
+    def test_conflicting_ids_in_batch_enqueue_nothing(self):
+        jobs = [_transfer_job("x"), _transfer_job("y"), _transfer_job("x", volume=20.0)]
+        with self.assertRaises(ValueError):
+            self.manager.submit_many(jobs)
+        self.assertIsNone(self.manager.status("x"))
+        self.assertIsNone(self.manager.status("y"))
+        # The rejected batch must not block a later submission of its jobs
+        self.assertEqual(self.manager.submit(_transfer_job("x")), "x")
+        self.assertEqual(self.manager.state["queued_jobs"], 1)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("x"), JobState.COMPLETED)
+
+    def test_state_is_snapshot(self):
+        state = self.manager.state
+        self.manager.submit(_transfer_job("j1"))
+        self.assertNotIn("j1", state["job_status"])
+        self.assertEqual(self.manager.state["job_status"]["j1"], "pending")
+        # Plain dicts, so the summary can be serialized directly
+        json.dumps(self.manager.state)
+
+    def test_status_transitions(self):
+        self.manager.submit(_transfer_job("j1"))
+        # Pausing a pending job has no effect
+        self.manager.pause("j1")
+        self.assertEqual(self.manager.status("j1"), JobState.PENDING)
+        self.manager.run_next()
+        self.assertEqual(self.manager.status("j1"), "completed")
+        # Completed jobs cannot be aborted and unknown jobs are not recorded
+        self.manager.abort("j1")
+        self.manager.abort("missing")
+        self.assertEqual(self.manager.status("j1"), JobState.COMPLETED)
+        self.assertIsNone(self.manager.status("missing"))
+
+    def test_run_matches_compile_and_simulate(self):
+        job = _transfer_job("j1")
+        job.steps.append(IRStep(id="s2", op="wash", args={"scheme": 1}))
+        self.manager.submit(job)
+        self.assertEqual(self.manager.run_next(), (compile_ir(job), simulate_ir(job)))
+
+    def test_run_revalidates_against_current_deck(self):
+        self.manager.submit(_transfer_job("j1"))
+        del self.manager.deck_state["S1"]
+        with self.assertRaises(ValueError) as ctx:
+            self.manager.run_next()
+        self.assertIn("LABWARE_NOT_FOUND", str(ctx.exception))
+        self.assertEqual(self.manager.status("j1"), JobState.ERROR)
+
+
+class TestPooledJobManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = JobManager(deck_state={"S1": {}, "D1": {}}, max_workers=2)
+
+    def tearDown(self):
+        self.manager.shutdown()
+
+    def test_submit_runs_job_in_background(self):
+        job_id = self.manager.submit(_transfer_job("j1"))
+        worklist, sim_state = self.manager.result(job_id, timeout=5)
+        self.assertEqual(len(worklist), 2)
+        self.assertAlmostEqual(sim_state["D1"][1], 10.0)
+        self.assertEqual(self.manager.status(job_id), "completed")
+        # Pooled jobs are never placed on the synchronous queue
+        with self.assertRaises(IndexError):
+            self.manager.run_next()
+
+    def test_many_jobs_complete(self):
+        ids = self.manager.submit_many([_transfer_job(f"j{i}") for i in range(8)])
+        for job_id in ids:
+            self.manager.result(job_id, timeout=5)
+            self.assertEqual(self.manager.status(job_id), "completed")
+
+    def test_result_is_released_once_collected(self):
+        job_id = self.manager.submit(_transfer_job("j1"))
+        self.manager.result(job_id, timeout=5)
+        self.assertNotIn(job_id, self.manager._futures)
+        with self.assertRaises(KeyError):
+            self.manager.result(job_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,18 @@ These tests verify that generating IR from text returns an IR job and
 that the repair loop raises errors when validation fails.
 """
 
+import threading
 import unittest
+from unittest import mock
 
+from fluent_llm import llm_integration
 from fluent_llm.llm_integration import generate_ir_from_text
 
 
 class TestLLMIntegration(unittest.TestCase):
+    def setUp(self):
+        llm_integration._PLAN_CACHE.clear()
+
     def test_generate_ir_valid(self):
         description = "Transfer 50 uL from plate S1 A1 to plate D1 B1"
         # Provide deck state so that preflight passes
@@ -26,6 +32,59 @@ class TestLLMIntegration(unittest.TestCase):
         with self.assertRaises(ValueError):
             generate_ir_from_text(description, deck_state=deck_state)
 
+    def test_repeated_request_served_from_cache(self):
+        description = "Transfer 50 uL from plate S1 A1 to plate D1 B1"
+        deck_state = {"S1": {}, "D1": {}}
+        first = generate_ir_from_text(description, deck_state=deck_state)
+        first.steps[0].args["volume_uL"] = 999.0
+        with mock.patch.object(llm_integration, "plan_from_text") as planner:
+            second = generate_ir_from_text(description, deck_state=deck_state)
+        planner.assert_not_called()
+        # Callers receive independent copies of the cached plan
+        self.assertIsNot(second, first)
+        self.assertEqual(second.steps[0].args["volume_uL"], 50.0)
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        description = "Transfer 50 uL from plate S1 A1 to plate D1 B1"
+        deck_state = {"S1": {}, "D1": {}}
+        n_waiters = 3
+        release = threading.Event()
+        all_waiting = threading.Event()
+        waiting = []
+        calls = []
+        real_plan = llm_integration.plan_from_text
+
+        class CountingFuture(llm_integration.Future):
+            def result(self, timeout=None):
+                waiting.append(1)
+                if len(waiting) == n_waiters:
+                    all_waiting.set()
+                return super().result(timeout)
+
+        def slow_plan(text):
+            calls.append(text)
+            release.wait(5)
+            return real_plan(text)
+
+        results = []
+
+        def worker():
+            results.append(generate_ir_from_text(description, deck_state))
+
+        with mock.patch.object(llm_integration, "plan_from_text", slow_plan), \
+                mock.patch.object(llm_integration, "Future", CountingFuture):
+            threads = [threading.Thread(target=worker) for _ in range(n_waiters + 1)]
+            for thread in threads:
+                thread.start()
+            # Let the planner finish only once every duplicate is waiting
+            self.assertTrue(all_waiting.wait(5))
+            release.set()
+            for thread in threads:
+                thread.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), n_waiters + 1)
+        self.assertFalse(llm_integration._INFLIGHT)
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -20,6 +20,44 @@ class TestLLMStub(unittest.TestCase):
         self.assertEqual(transfer.args["dest_well"], "C3")
         self.assertEqual(transfer.args["volume_uL"], 60.0)
 
+    def test_plan_shares_repeated_labware_names(self):
+        description = (
+            "Transfer 10 uL from plate P1 A1 to plate Q1 B1 and "
+            "transfer 20 uL from plate P1 A2 to plate Q1 B2"
+        )
+        first, second = plan_from_text(description).steps
+        self.assertIs(first.args["source_labware"], second.args["source_labware"])
+        self.assertIs(first.args["dest_labware"], second.args["dest_labware"])
+
+    def test_plan_orders_transfers_before_wash_and_decontaminate(self):
+        description = (
+            "Decontaminate and wash, then transfer 5 uL from plate P1 A1 "
+            "to plate Q1 B1 and wash again."
+        )
+        ops = [step.op for step in plan_from_text(description).steps]
+        self.assertEqual(ops, ["transfer", "wash", "decontaminate"])
+
+    def test_keywords_inside_transfer_phrase_still_count(self):
+        ops = [step.op for step in plan_from_text("Transfer 10 uL from plate Wash1 A1 to plate D1 B1").steps]
+        self.assertEqual(ops, ["transfer", "wash"])
+
+    def test_job_id_is_stable_content_hash(self):
+        description = "Wash the tips."
+        job_id = plan_from_text(description).job_id
+        self.assertEqual(job_id, plan_from_text(description).job_id)
+        self.assertRegex(job_id, r"^job[0-9a-f]{10}$")
+        self.assertNotEqual(job_id, plan_from_text("Decontaminate the tips.").job_id)
+
+    def test_repeated_plans_are_independent_copies(self):
+        description = "Transfer 10 uL from plate P1 A1 to plate Q1 B1 and wash."
+        first = plan_from_text(description)
+        first.steps[0].args["volume_uL"] = 99.0
+        first.steps.pop()
+        second = plan_from_text(description)
+        self.assertEqual(len(second.steps), 2)
+        self.assertEqual(second.steps[0].args["volume_uL"], 10.0)
+        self.assertEqual(second.job_id, first.job_id)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
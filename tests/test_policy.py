@@ -8,7 +8,7 @@ unknown operations.
 import unittest
 
 from fluent_llm.ir import IRStep
-from fluent_llm.policy import classify_step, is_allowed
+from fluent_llm.policy import ALLOW, BLOCK, CONFIRM, classify_step, classify_steps, is_allowed
 
 
 class TestPolicy(unittest.TestCase):
@@ -27,6 +27,12 @@ class TestPolicy(unittest.TestCase):
         self.assertEqual(classify_step(unknown), "block")
         self.assertFalse(is_allowed(unknown))
 
+    def test_classify_steps_bulk(self):
+        ops = ["transfer", "decontaminate", "mix", "wash"]
+        self.assertEqual(classify_steps(ops), [ALLOW, CONFIRM, BLOCK, ALLOW])
+        self.assertEqual(classify_steps(iter(["decontaminate"] * 3)), [CONFIRM] * 3)
+        self.assertEqual(classify_steps([]), [])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -3,7 +3,7 @@
 import unittest
 
 from fluent_llm.ir import IRJob, IRStep
-from fluent_llm.preflight import preflight_check
+from fluent_llm.preflight import format_preflight_errors, get_step_validator, preflight_check
 from fluent_llm.state import ErrorType
 
 
@@ -58,6 +58,92 @@ class TestPreflight(unittest.TestCase):
         errors = preflight_check(job, self.deck_state)
         self.assertTrue(any(err[1] == ErrorType.VOLUME_OUT_OF_RANGE for err in errors))
 
+    def test_preflight_volume_below_registry_minimum(self):
+        job = IRJob(
+            version="1.0",
+            job_id="job4",
+            steps=[IRStep(id="s1", op="transfer", args={
+                "source_labware": "S1",
+                "source_well": "A1",
+                "dest_labware": "D1",
+                "dest_well": "B1",
+                "volume_uL": 0.05  # Below the 0.1 µL minimum in capabilities.yaml
+            })]
+        )
+        errors = preflight_check(job, self.deck_state)
+        self.assertEqual([err[1] for err in errors], [ErrorType.VOLUME_OUT_OF_RANGE])
+
+    def test_preflight_wash_scheme(self):
+        job = IRJob(
+            version="1.0",
+            job_id="job5",
+            steps=[
+                IRStep(id="s1", op="wash", args={"scheme": 2}),
+                IRStep(id="s2", op="wash", args={"scheme": 9}),
+                IRStep(id="s3", op="mix", args={}),
+                # Unhashable schemes are reported rather than raising
+                IRStep(id="s4", op="wash", args={"scheme": [1]}),
+            ]
+        )
+        errors = preflight_check(job, self.deck_state)
+        self.assertEqual(
+            [(err[0], err[1]) for err in errors],
+            [
+                ("s2", ErrorType.INVALID_ARGUMENT),
+                ("s3", ErrorType.UNKNOWN_OPERATION),
+                ("s4", ErrorType.INVALID_ARGUMENT),
+            ],
+        )
+
+    def test_preflight_errors_behave_like_tuples(self):
+        job = IRJob(
+            version="1.0",
+            job_id="job6",
+            steps=[IRStep(id="s1", op="mix", args={})]
+        )
+        (error,) = preflight_check(job, self.deck_state)
+        step_id, error_type, message = error
+        self.assertEqual((step_id, error_type), ("s1", ErrorType.UNKNOWN_OPERATION))
+        self.assertEqual(message, "Unknown op: mix")
+        self.assertEqual(error, ("s1", ErrorType.UNKNOWN_OPERATION, "Unknown op: mix"))
+        self.assertEqual(error[2], error.message)
+
+    def test_preflight_valid_mixed_job(self):
+        job = IRJob(
+            version="1.0",
+            job_id="job7",
+            steps=[
+                IRStep(id="s1", op="transfer", args={
+                    "source_labware": "S1",
+                    "source_well": "A1",
+                    "dest_labware": "D1",
+                    "dest_well": "B1",
+                    "volume_uL": 10.0
+                }),
+                IRStep(id="s2", op="wash", args={"scheme": 1}),
+                IRStep(id="s3", op="decontaminate", args={}),
+            ]
+        )
+        self.assertEqual(preflight_check(job, self.deck_state), [])
+        # A single bad step anywhere still reports exactly that step
+        job.steps.append(IRStep(id="s4", op="wash", args={"scheme": 9}))
+        errors = preflight_check(job, self.deck_state)
+        self.assertEqual([(err[0], err[1]) for err in errors], [("s4", ErrorType.INVALID_ARGUMENT)])
+
+    def test_step_validator_matches_preflight_check(self):
+        steps = [
+            IRStep(id="s1", op="transfer", args={"source_labware": "S9", "dest_labware": "D1", "volume_uL": 5.0}),
+            IRStep(id="s2", op="mix", args={}),
+        ]
+        job = IRJob(version="1.0", job_id="job9", steps=steps)
+        validate_step = get_step_validator()
+        per_step = [err for step in steps for err in validate_step(step, self.deck_state)]
+        self.assertEqual(per_step, preflight_check(job, self.deck_state))
+        self.assertEqual(
+            format_preflight_errors(per_step, prefix="job9/"),
+            ["job9/s1: LABWARE_NOT_FOUND – Source labware S9 missing", "job9/s2: UNKNOWN_OPERATION – Unknown op: mix"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -24,6 +24,40 @@ class TestSimulator(unittest.TestCase):
         self.assertAlmostEqual(state["S1"][0], -25.0)
         self.assertAlmostEqual(state["D1"][1], 25.0)
 
+    def test_simulate_with_initial_state(self):
+        initial = {"S1": [100.0] * 96, "R1": [5.0] * 96}
+        job = IRJob(
+            version="1.0",
+            job_id="job2",
+            steps=[
+                IRStep(id="s1", op="transfer", args={
+                    "source_labware": "S1",
+                    "source_well": "A1",
+                    "dest_labware": "D1",
+                    "dest_well": "A1",
+                    "volume_uL": 30.0
+                }),
+                IRStep(id="s2", op="wash", args={}),
+                IRStep(id="s3", op="transfer", args={
+                    "source_labware": "S1",
+                    "source_well": "A1",
+                    "dest_labware": "D1",
+                    "dest_well": "A1",
+                    "volume_uL": 20.0
+                }),
+            ]
+        )
+        state = simulate_ir(job, initial_state=initial)
+        self.assertEqual(list(state), ["S1", "R1", "D1"])
+        self.assertAlmostEqual(state["S1"][0], 50.0)
+        self.assertAlmostEqual(state["D1"][0], 50.0)
+        self.assertEqual(state["R1"], [5.0] * 96)
+        # Untouched labware is copied too, so the result can be modified
+        state["R1"][0] = 0.0
+        self.assertEqual(initial["R1"][0], 5.0)
+        # The caller's initial state is not modified
+        self.assertEqual(initial["S1"][0], 100.0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file